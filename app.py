@@ -12,7 +12,6 @@ This file orchestrates the app flow. Business logic is in separate modules:
 - auth/ - Authentication
 """
 from dotenv import load_dotenv
-import os
 import streamlit as st
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -35,18 +34,6 @@ PINECONE_INDEX = "buddy-ai-index"
 
 load_dotenv(APP_DIR / ".env")
 
-
-def get_secret(key: str, default: str = None) -> str:
-    """Get secret from Streamlit secrets or environment variables"""
-    # Try Streamlit secrets first (for cloud deployment)
-    try:
-        if hasattr(st, 'secrets') and key in st.secrets:
-            return st.secrets[key]
-    except Exception:
-        pass
-    # Fall back to environment variables (for local development)
-    return os.getenv(key, default)
-
 # Page config - MUST be first Streamlit command
 st.set_page_config(
     page_title="Buddy AI - Career Counsellor",
@@ -74,7 +61,7 @@ if session_created:
         st.stop()
 
 # ========== IMPORT MODULES ==========
-from utils import sanitize_input, check_rate_limit, retry_with_backoff
+from utils import sanitize_input, check_rate_limit, retry_with_backoff, get_secret
 from ui.styles import inject_styles, inject_sidebar_styles
 from ui.components import render_header, render_sidebar, render_welcome, render_messages
 from chat import (
@@ -108,14 +95,12 @@ except ImportError:
     CANONICAL_OUT_OF_SCOPE_RESPONSE = "I'm sorry — I don't have the right context to answer this. I can help with careers, education, and future planning."
 
 try:
-    from conversation import StateDetector, ResponseGenerator
-    from prompts import ResponseGuardrails
-    from memory import ProfileExtractor, MemoryStore, MemoryReferencer
-
-    state_detector = StateDetector()
-    response_generator = ResponseGenerator()
-    guardrails = ResponseGuardrails()
-    profile_extractor = ProfileExtractor()
+    # Stateless helpers are module-level singletons, so a rerun reuses
+    # them instead of rebuilding their compiled patterns
+    from conversation import state_detector, response_generator
+    from prompts import guardrails
+    from memory import profile_extractor, MemoryStore, MemoryReferencer
+
     memory_store = MemoryStore(db_path=str(DATA_PATH / "buddy_ai.db"))
     memory_referencer = MemoryReferencer(memory_store)
     MODULES_LOADED = True
@@ -130,6 +115,8 @@ if "current_chat_id" not in st.session_state:
     st.session_state.current_chat_id = None
 if "chat_list" not in st.session_state:
     st.session_state.chat_list = load_chat_history()
+if "chat_list_version" not in st.session_state:
+    st.session_state.chat_list_version = 0
 if "sidebar_open" not in st.session_state:
     st.session_state.sidebar_open = False
 if "suggestion_clicked" not in st.session_state:
@@ -189,9 +176,12 @@ try:
             from prompts import get_system_prompt
             base_system_prompt = get_system_prompt()
 
-            prompt = ChatPromptTemplate.from_template(base_system_prompt + """
-
-## CURRENT CONTEXT
+            # The system message holds only the static prompt and per-state
+            # instructions so the provider's prompt cache can reuse it across
+            # turns; everything that changes per turn goes in the next message
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", base_system_prompt + "\n{state_instructions}"),
+                ("human", """## CURRENT CONTEXT
 Chat History:
 {history}
 
@@ -199,12 +189,12 @@ Career Information:
 {context}
 
 {memory_context}
-{state_instructions}
 
 Student's Question: {question}
 
 Remember: Respond like a warm elder sibling. Keep it simple. Max 1-2 questions. Max 1 emoji.
-""")
+"""),
+            ])
 
             def format_docs(docs):
                 return "\n\n".join(doc.page_content for doc in docs)
@@ -1,6 +1,7 @@
 """Authentication handler for Buddy AI"""
 import bcrypt
 import logging
+import os
 from typing import Optional, Tuple, Dict, Any
 from datetime import datetime
 
@@ -8,6 +9,8 @@ from sqlalchemy import create_engine, Column, Integer, String, DateTime, Foreign
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 
+from db import enable_sqlite_pragmas
+
 from .session_manager import SessionManager
 from .validators import validate_email_domain, validate_password_strength, validate_grade
 
@@ -57,6 +60,7 @@ class AuthHandler:
             secret_key: Secret key for session management
         """
         self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        enable_sqlite_pragmas(self.engine)
         Base.metadata.create_all(self.engine)
 
         Session = sessionmaker(bind=self.engine)
@@ -105,7 +109,8 @@ class AuthHandler:
 
     def _hash_password(self, password: str) -> str:
         """Hash a password using bcrypt"""
-        salt = bcrypt.gensalt()
+        # Cost factor can be lowered (e.g. under tests) via BCRYPT_ROUNDS
+        salt = bcrypt.gensalt(rounds=int(os.getenv("BCRYPT_ROUNDS", "12")))
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
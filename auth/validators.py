@@ -1,15 +1,21 @@
 """Validation utilities for authentication"""
 import re
-from typing import Tuple, Optional
+from typing import Iterable, Tuple, Optional
 
+# Compiled once at import; the domain is captured so it needn't be split out
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})$')
+HAS_LETTER_PATTERN = re.compile(r'[a-zA-Z]')
+HAS_DIGIT_PATTERN = re.compile(r'\d')
 
-def validate_email_domain(email: str, allowed_domains: list[str]) -> Tuple[bool, Optional[str]]:
+
+def validate_email_domain(email: str, allowed_domains: Iterable[str]) -> Tuple[bool, Optional[str]]:
     """
     Validate that email belongs to an allowed school domain.
 
     Args:
         email: The email address to validate
-        allowed_domains: List of allowed email domains (e.g., ['school.edu', 'academy.org'])
+        allowed_domains: Allowed email domains (e.g., ['school.edu', 'academy.org']).
+            A frozenset is used as-is and must already be lowercase.
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -18,19 +24,16 @@ def validate_email_domain(email: str, allowed_domains: list[str]) -> Tuple[bool,
         return False, "Email is required"
 
     # Basic email format validation
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
+    match = EMAIL_PATTERN.match(email)
+    if not match:
         return False, "Please enter a valid email address"
 
-    # Extract domain from email
-    try:
-        domain = email.split('@')[1].lower()
-    except IndexError:
-        return False, "Invalid email format"
+    domain = match.group(1).lower()
 
     # Check if domain is allowed
-    allowed_domains_lower = [d.lower() for d in allowed_domains]
-    if domain not in allowed_domains_lower:
+    if not isinstance(allowed_domains, frozenset):
+        allowed_domains = frozenset(d.lower() for d in allowed_domains)
+    if domain not in allowed_domains:
         return False, "Please use your school email address"
 
     return True, None
@@ -57,10 +60,10 @@ def validate_password_strength(password: str) -> Tuple[bool, Optional[str]]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
 
-    if not re.search(r'[a-zA-Z]', password):
+    if not HAS_LETTER_PATTERN.search(password):
         return False, "Password must contain at least one letter"
 
-    if not re.search(r'\d', password):
+    if not HAS_DIGIT_PATTERN.search(password):
         return False, "Password must contain at least one number"
 
     return True, None
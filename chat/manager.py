@@ -3,6 +3,7 @@ import json
 import uuid
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 
@@ -63,11 +64,25 @@ def load_chat_history() -> List[Dict[str, Any]]:
     return []
 
 
+@lru_cache(maxsize=2048)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp string; cached since stored timestamps never change"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@lru_cache(maxsize=2048)
+def _format_date(dt: datetime) -> str:
+    """Absolute date label for timestamps older than a week"""
+    return dt.strftime("%b %d")
+
+
 def format_timestamp(dt: Any) -> str:
     """Format timestamp for display"""
+    # Only parsing and the absolute date are cached; the relative labels
+    # depend on the current time and are recomputed on every call
     try:
         if isinstance(dt, str):
-            dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
+            dt = _parse_timestamp(dt)
         now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
         diff = now - dt
 
@@ -84,12 +99,17 @@ def format_timestamp(dt: Any) -> str:
         elif diff < timedelta(days=7):
             return f"{diff.days}d ago"
         else:
-            return dt.strftime("%b %d")
+            return _format_date(dt)
     except (ValueError, TypeError, AttributeError) as e:
         logger.debug(f"Failed to format timestamp: {e}")
         return ""
 
 
+def _bump_chat_list_version() -> None:
+    """Mark the chat list as changed so derived sidebar rows are rebuilt"""
+    st.session_state.chat_list_version = st.session_state.get("chat_list_version", 0) + 1
+
+
 def generate_chat_title(first_message: str) -> str:
     """Generate a title from the first message"""
     title = first_message[:35].strip()
@@ -109,6 +129,7 @@ def create_new_chat() -> Dict[str, Any]:
         "messages": []
     }
     st.session_state.chat_list.insert(0, new_chat)
+    _bump_chat_list_version()
     save_chat_history()
     return new_chat
 
@@ -127,6 +148,7 @@ def update_chat_title(chat_id: str, new_title: str) -> bool:
     if chat:
         chat["title"] = new_title
         chat["updated_at"] = datetime.now()
+        _bump_chat_list_version()
         return True
     return False
 
@@ -134,6 +156,7 @@ def update_chat_title(chat_id: str, new_title: str) -> bool:
 def delete_chat(chat_id: str) -> bool:
     """Delete a chat"""
     st.session_state.chat_list = [c for c in st.session_state.chat_list if c["id"] != chat_id]
+    _bump_chat_list_version()
     save_chat_history()
     return True
 
@@ -143,6 +166,7 @@ def delete_all_chats() -> None:
     st.session_state.chat_list = []
     st.session_state.current_chat_id = None
     st.session_state.messages = []
+    _bump_chat_list_version()
     save_chat_history()
 
 
@@ -154,6 +178,7 @@ def add_message_to_chat(chat_id: str, content: str, role: str) -> bool:
         chat["updated_at"] = datetime.now()
         if role == "user" and chat["title"] == "New Chat":
             chat["title"] = generate_chat_title(content)
+            _bump_chat_list_version()
         save_chat_history()
         return True
     return False
@@ -164,9 +189,21 @@ def add_message_to_chat(chat_id: str, content: str, role: str) -> bool:
 def get_active_chat() -> Optional[Dict[str, Any]]:
     """Get the currently active chat"""
     chat_id = st.session_state.get("current_chat_id")
-    if chat_id:
-        return get_chat_by_id(chat_id)
-    return None
+    if not chat_id:
+        return None
+
+    # The lookup is a linear scan of the chat list, so reuse the last result
+    # until the active chat or the list itself changes. Messages are appended
+    # to the chat dict in place, so the cached chat always has them.
+    key = (chat_id, st.session_state.get("chat_list_version", 0))
+    cached = st.session_state.get("_active_chat")
+    if cached and cached[0] == key:
+        return cached[1]
+
+    chat = get_chat_by_id(chat_id)
+    if chat:
+        st.session_state._active_chat = (key, chat)
+    return chat
 
 
 def get_active_messages() -> List[Dict[str, str]]:
@@ -3,13 +3,37 @@ Configuration management for Buddy AI.
 All settings are centralized here and can be overridden via environment variables.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, InitVar
+from typing import Mapping, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Settings that environment variables of the same name override, with the
+# type each value is parsed as
+CONFIG_ENV_VARS = {
+    # RAG
+    "CHUNK_SIZE": int,
+    "CHUNK_OVERLAP": int,
+    "RETRIEVER_K": int,
+    "LLM_TEMPERATURE": float,
+    "LLM_MODEL": str,
+    "PINECONE_INDEX": str,
+    # Rate Limiting
+    "RATE_LIMIT_MESSAGES": int,
+    "RATE_LIMIT_WINDOW": int,
+    # Session
+    "SESSION_TIMEOUT_HOURS": int,
+    # Input
+    "MAX_INPUT_LENGTH": int,
+    # Memory
+    "MEMORY_REFERENCE_INTERVAL": int,
+    # Logging
+    "LOG_LEVEL": str,
+}
+
 
 @dataclass
 class AppConfig:
@@ -47,7 +71,10 @@ class AppConfig:
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-    def __post_init__(self):
+    # Override values to use instead of os.environ; not stored as a field
+    env: InitVar[Optional[Mapping[str, Optional[str]]]] = None
+
+    def __post_init__(self, env: Optional[Mapping[str, Optional[str]]] = None):
         """Initialize paths and load environment overrides."""
         # Set up paths
         self.DATA_PATH = self.APP_DIR / "data"
@@ -55,33 +82,14 @@ class AppConfig:
         self.CHAT_HISTORY_FILE = self.DATA_PATH / "chat_history.json"
 
         # Load environment variable overrides
-        self._load_env_overrides()
+        self._load_env_overrides(os.environ if env is None else env)
 
-    def _load_env_overrides(self):
+    def _load_env_overrides(self, env: Mapping[str, Optional[str]]):
         """Load configuration from environment variables."""
-        # RAG
-        self.CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", self.CHUNK_SIZE))
-        self.CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", self.CHUNK_OVERLAP))
-        self.RETRIEVER_K = int(os.getenv("RETRIEVER_K", self.RETRIEVER_K))
-        self.LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", self.LLM_TEMPERATURE))
-        self.LLM_MODEL = os.getenv("LLM_MODEL", self.LLM_MODEL)
-        self.PINECONE_INDEX = os.getenv("PINECONE_INDEX", self.PINECONE_INDEX)
-
-        # Rate Limiting
-        self.RATE_LIMIT_MESSAGES = int(os.getenv("RATE_LIMIT_MESSAGES", self.RATE_LIMIT_MESSAGES))
-        self.RATE_LIMIT_WINDOW = int(os.getenv("RATE_LIMIT_WINDOW", self.RATE_LIMIT_WINDOW))
-
-        # Session
-        self.SESSION_TIMEOUT_HOURS = int(os.getenv("SESSION_TIMEOUT_HOURS", self.SESSION_TIMEOUT_HOURS))
-
-        # Input
-        self.MAX_INPUT_LENGTH = int(os.getenv("MAX_INPUT_LENGTH", self.MAX_INPUT_LENGTH))
-
-        # Memory
-        self.MEMORY_REFERENCE_INTERVAL = int(os.getenv("MEMORY_REFERENCE_INTERVAL", self.MEMORY_REFERENCE_INTERVAL))
-
-        # Logging
-        self.LOG_LEVEL = os.getenv("LOG_LEVEL", self.LOG_LEVEL)
+        for name, parse in CONFIG_ENV_VARS.items():
+            value = env.get(name)
+            if value is not None:
+                setattr(self, name, parse(value))
 
 
 @dataclass
@@ -108,11 +116,21 @@ def validate_environment() -> tuple[bool, list[str]]:
     return len(missing) == 0, missing
 
 
+@lru_cache(maxsize=8)
+def _build_config(env_values: tuple) -> AppConfig:
+    """Build one AppConfig per distinct set of override values."""
+    return AppConfig(env=dict(zip(CONFIG_ENV_VARS, env_values)))
+
+
 def get_config() -> AppConfig:
     """Get the application configuration singleton."""
-    if not hasattr(get_config, "_instance"):
-        get_config._instance = AppConfig()
-    return get_config._instance
+    # Keyed on the override values so a changed environment gets a fresh config
+    return _build_config(tuple(os.getenv(name) for name in CONFIG_ENV_VARS))
+
+
+def clear_config_cache() -> None:
+    """Drop cached configs so the next get_config() builds a new one."""
+    _build_config.cache_clear()
 
 
 def setup_logging(config: Optional[AppConfig] = None) -> None:
@@ -1,11 +1,13 @@
 """Conversation Decision Framework for Buddy AI"""
 from .constants import ConversationState, CANONICAL_OUT_OF_SCOPE_RESPONSE
-from .state_detector import StateDetector
-from .response_generator import ResponseGenerator
+from .state_detector import StateDetector, state_detector
+from .response_generator import ResponseGenerator, response_generator
 
 __all__ = [
     'ConversationState',
     'CANONICAL_OUT_OF_SCOPE_RESPONSE',
     'StateDetector',
-    'ResponseGenerator'
+    'state_detector',
+    'ResponseGenerator',
+    'response_generator'
 ]
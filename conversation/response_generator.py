@@ -108,6 +108,13 @@ class ResponseGenerator:
         Returns:
             Instruction string to include in the prompt
         """
+        # Instructions depend only on the state, so they are built once at
+        # import time
+        return _STATE_INSTRUCTIONS[state]
+
+    @staticmethod
+    def _build_state_instructions(state: ConversationState) -> str:
+        """Render the instruction text for a state"""
         guidelines = STATE_GUIDELINES.get(state, STATE_GUIDELINES[ConversationState.CAREER_CURIOSITY])
 
         instructions = f"""
@@ -211,3 +218,13 @@ EXAMPLE RESPONSE STYLE:
             ],
             "use_canonical": self.should_use_canonical_response(state)
         }
+
+
+_STATE_INSTRUCTIONS = {
+    state: ResponseGenerator._build_state_instructions(state)
+    for state in ConversationState
+}
+
+
+# Shared instance; the generator holds no per-conversation state
+response_generator = ResponseGenerator()
@@ -18,6 +18,43 @@ from .constants import (
 logger = logging.getLogger(__name__)
 
 
+def _compile_alternation(patterns: List[str], bounded: bool = False) -> "re.Pattern[str]":
+    """
+    Compile a pattern list into one alternation.
+
+    Input is lowercased once before matching, so the patterns are lowercased
+    here too. Longest patterns go first so a phrase is never shadowed by one
+    of its own prefixes.
+    """
+    alternatives = sorted({p.lower() for p in patterns}, key=len, reverse=True)
+    body = "|".join(map(re.escape, alternatives))
+    if bounded:
+        body = r"\b(?:" + body + r")\b"
+    return re.compile(body)
+
+
+# One compiled alternation per pattern group, built once per process. Each
+# message is scanned once per group instead of once per pattern.
+_OUT_OF_SCOPE_RES = {
+    category: _compile_alternation(patterns, bounded=True)
+    for category, patterns in OUT_OF_SCOPE_PATTERNS.items()
+}
+_GREETING_RE = _compile_alternation(GREETING_PATTERNS)
+_CONFUSION_RE = _compile_alternation(CONFUSION_PATTERNS)
+_VALIDATION_RE = _compile_alternation(VALIDATION_PATTERNS)
+_SELF_REFLECTION_RE = _compile_alternation(SELF_REFLECTION_PATTERNS)
+_CAREER_RE = _compile_alternation(CAREER_PATTERNS)
+_COMPARISON_RE = _compile_alternation(COMPARISON_PATTERNS)
+_INFORMATION_RE = _compile_alternation(INFORMATION_PATTERNS)
+
+# Self-reflection exceptions: questions are not reflection unless the
+# student is also sharing something about themselves
+_QUESTION_RE = _compile_alternation(["what", "how", "which", "where", "when", "why", "?"])
+_SHARING_RE = _compile_alternation(
+    ["i like", "i love", "i enjoy", "i hate", "i'm good at", "i prefer"]
+)
+
+
 class StateDetector:
     """
     Detects the current conversation state based on user input.
@@ -36,99 +73,64 @@ class StateDetector:
     """
 
     def __init__(self):
-        self._compile_patterns()
-
-    def _compile_patterns(self):
-        """Pre-compile regex patterns for efficiency"""
-        # Compile out-of-scope patterns
-        self.out_of_scope_compiled = {}
-        for category, patterns in OUT_OF_SCOPE_PATTERNS.items():
-            self.out_of_scope_compiled[category] = [
-                re.compile(r'\b' + re.escape(p) + r'\b', re.IGNORECASE)
-                for p in patterns
-            ]
+        self.out_of_scope_compiled = _OUT_OF_SCOPE_RES
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for pattern matching"""
         return text.lower().strip()
 
-    def _check_patterns(self, text: str, patterns: List[str]) -> bool:
-        """Check if any pattern matches in the text"""
-        text_lower = self._normalize_text(text)
-        for pattern in patterns:
-            if pattern.lower() in text_lower:
-                return True
-        return False
-
-    def _check_out_of_scope(self, text: str) -> Optional[str]:
+    def _check_out_of_scope(self, text_lower: str) -> Optional[str]:
         """
-        Check if text contains out-of-scope topics.
+        Check if normalized text contains out-of-scope topics.
 
         Returns the category if found, None otherwise.
         """
-        text_lower = self._normalize_text(text)
-
-        for category, compiled_patterns in self.out_of_scope_compiled.items():
-            for pattern in compiled_patterns:
-                if pattern.search(text_lower):
-                    logger.info(f"Out-of-scope detected: {category}")
-                    return category
+        for category, pattern in self.out_of_scope_compiled.items():
+            if pattern.search(text_lower):
+                logger.info(f"Out-of-scope detected: {category}")
+                return category
 
         return None
 
-    def _is_greeting(self, text: str) -> bool:
+    def _is_greeting(self, text_lower: str) -> bool:
         """Check if the message is a greeting"""
-        text_lower = self._normalize_text(text)
+        # Short messages (likely greetings) may contain the greeting anywhere;
+        # longer ones only count if they start with it
+        if len(text_lower.split(None, 3)) <= 3:
+            return _GREETING_RE.search(text_lower) is not None
+        return _GREETING_RE.match(text_lower) is not None
 
-        # Check if it's a short message (likely greeting)
-        words = text_lower.split()
-        if len(words) <= 3:
-            return self._check_patterns(text, GREETING_PATTERNS)
-
-        # For longer messages, only check if it starts with a greeting
-        for pattern in GREETING_PATTERNS:
-            if text_lower.startswith(pattern.lower()):
-                return True
-
-        return False
-
-    def _is_confused(self, text: str) -> bool:
+    def _is_confused(self, text_lower: str) -> bool:
         """Check if student is expressing confusion"""
-        return self._check_patterns(text, CONFUSION_PATTERNS)
+        return _CONFUSION_RE.search(text_lower) is not None
 
-    def _is_validation_seeking(self, text: str) -> bool:
+    def _is_validation_seeking(self, text_lower: str) -> bool:
         """Check if student is seeking validation/approval"""
-        return self._check_patterns(text, VALIDATION_PATTERNS)
+        return _VALIDATION_RE.search(text_lower) is not None
 
-    def _is_self_reflection(self, text: str) -> bool:
+    def _is_self_reflection(self, text_lower: str) -> bool:
         """Check if student is expressing self-reflection"""
-        text_lower = self._normalize_text(text)
-
-        # Check for self-reflection patterns
-        if self._check_patterns(text, SELF_REFLECTION_PATTERNS):
-            # Make sure it's not also a question
-            question_words = ["what", "how", "which", "where", "when", "why", "?"]
-            is_question = any(q in text_lower for q in question_words)
-
-            # Self-reflection takes priority if the student is sharing about themselves
-            return not is_question or any(
-                p.lower() in text_lower
-                for p in ["i like", "i love", "i enjoy", "i hate", "i'm good at", "i prefer"]
-            )
+        if not _SELF_REFLECTION_RE.search(text_lower):
+            return False
 
-        return False
+        # Self-reflection takes priority if the student is sharing about
+        # themselves, even when phrased as a question
+        return (
+            not _QUESTION_RE.search(text_lower)
+            or _SHARING_RE.search(text_lower) is not None
+        )
 
-    def _is_career_curiosity(self, text: str) -> bool:
+    def _is_career_curiosity(self, text_lower: str) -> bool:
         """Check if student is curious about a specific career"""
-        return self._check_patterns(text, CAREER_PATTERNS)
+        return _CAREER_RE.search(text_lower) is not None
 
-    def _is_comparison(self, text: str) -> bool:
+    def _is_comparison(self, text_lower: str) -> bool:
         """Check if student is comparing options"""
-        return self._check_patterns(text, COMPARISON_PATTERNS)
+        return _COMPARISON_RE.search(text_lower) is not None
 
-    def _is_information_seeking(self, text: str) -> bool:
+    def _is_information_seeking(self, text_lower: str) -> bool:
         """Check if student is seeking factual information"""
-        return self._check_patterns(text, INFORMATION_PATTERNS)
+        return _INFORMATION_RE.search(text_lower) is not None
 
     def detect_state(
         self,
@@ -157,48 +159,49 @@ class StateDetector:
         7. COMPARISON
         8. INFORMATION_SEEKING
         """
-        if not user_input or not user_input.strip():
+        text_lower = self._normalize_text(user_input) if user_input else ""
+        if not text_lower:
             return ConversationState.CONFUSED
 
         # 1. Check for out-of-scope topics first (SAFETY)
-        out_of_scope_category = self._check_out_of_scope(user_input)
+        out_of_scope_category = self._check_out_of_scope(text_lower)
         if out_of_scope_category:
             logger.info(f"State: OUT_OF_SCOPE ({out_of_scope_category})")
             return ConversationState.OUT_OF_SCOPE
 
         # 2. Check for greeting
-        if self._is_greeting(user_input):
+        if self._is_greeting(text_lower):
             logger.info("State: GREETING")
             return ConversationState.GREETING
 
         # 3. Check for confusion (TRUST)
-        if self._is_confused(user_input):
+        if self._is_confused(text_lower):
             logger.info("State: CONFUSED")
             return ConversationState.CONFUSED
 
         # 4. Check for validation seeking (TRUST)
-        if self._is_validation_seeking(user_input):
+        if self._is_validation_seeking(text_lower):
             logger.info("State: VALIDATION_SEEKING")
             return ConversationState.VALIDATION_SEEKING
 
         # 5. Check for self-reflection (AWARENESS)
-        if self._is_self_reflection(user_input):
+        if self._is_self_reflection(text_lower):
             logger.info("State: SELF_REFLECTION")
             return ConversationState.SELF_REFLECTION
 
         # 6. Check for comparison (EXPLORATION)
         # Check comparison before career curiosity because comparisons are more specific
-        if self._is_comparison(user_input):
+        if self._is_comparison(text_lower):
             logger.info("State: COMPARISON")
             return ConversationState.COMPARISON
 
         # 7. Check for career curiosity (EXPLORATION)
-        if self._is_career_curiosity(user_input):
+        if self._is_career_curiosity(text_lower):
             logger.info("State: CAREER_CURIOSITY")
             return ConversationState.CAREER_CURIOSITY
 
         # 8. Check for information seeking (INFORMATION)
-        if self._is_information_seeking(user_input):
+        if self._is_information_seeking(text_lower):
             logger.info("State: INFORMATION_SEEKING")
             return ConversationState.INFORMATION_SEEKING
 
@@ -230,7 +233,9 @@ class StateDetector:
 
         # Add state-specific context
         if state == ConversationState.OUT_OF_SCOPE:
-            context["out_of_scope_category"] = self._check_out_of_scope(user_input)
+            context["out_of_scope_category"] = self._check_out_of_scope(
+                self._normalize_text(user_input)
+            )
 
         elif state == ConversationState.SELF_REFLECTION:
             # Extract what they're reflecting on
@@ -261,3 +266,7 @@ class StateDetector:
                     context["option_b"] = parts[1].strip()
 
         return context
+
+
+# Shared instance; the detector holds no per-conversation state
+state_detector = StateDetector()
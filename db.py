@@ -0,0 +1,26 @@
+"""Shared SQLite engine setup"""
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Applied to every new SQLite connection. WAL lets concurrent sessions read
+# while another one writes; NORMAL sync is safe under WAL.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune a freshly opened SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def enable_sqlite_pragmas(engine: Engine) -> None:
+    """Apply SQLITE_PRAGMAS to every connection the engine opens"""
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
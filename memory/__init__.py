@@ -1,10 +1,11 @@
 """Memory and student profiling system for Buddy AI"""
-from .profile_extractor import ProfileExtractor
+from .profile_extractor import ProfileExtractor, profile_extractor
 from .memory_store import MemoryStore
 from .memory_referencer import MemoryReferencer
 
 __all__ = [
     'ProfileExtractor',
+    'profile_extractor',
     'MemoryStore',
     'MemoryReferencer'
 ]
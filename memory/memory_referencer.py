@@ -67,6 +67,10 @@ class MemoryReferencer:
         # Track last reference for each student
         self._last_reference_message_idx: Dict[int, int] = {}
 
+        # Profile lines of the memory context per student, with the profile
+        # version they were built from
+        self._profile_context_cache: Dict[int, Tuple[int, List[str]]] = {}
+
     def should_reference_memory(
         self,
         student_id: int,
@@ -91,17 +95,10 @@ class MemoryReferencer:
             logger.debug(f"Rate limited: {current_message_idx - last_ref_idx} msgs since last ref")
             return False
 
-        # Check if we have relevant memories
-        profile_summary = self.memory_store.get_profile_summary(student_id)
-
-        has_memories = (
-            profile_summary.get("interests") or
-            profile_summary.get("dislikes") or
-            profile_summary.get("strengths") or
-            profile_summary.get("careers_discussed")
-        )
-
-        if not has_memories:
+        # Check if we have relevant memories. The profile context has a line
+        # for exactly the fields that count, and is cached per profile
+        # version, so this skips the database until the profile changes.
+        if not self._get_profile_context(student_id):
             return False
 
         # Random chance to include reference (don't always reference)
@@ -182,25 +179,18 @@ class MemoryReferencer:
         self._last_reference_message_idx[student_id] = message_idx
         logger.debug(f"Recorded reference at message {message_idx} for student {student_id}")
 
-    def build_memory_context(
-        self,
-        student_id: int,
-        include_reference: bool = False,
-        current_topic: Optional[str] = None,
-        current_input: Optional[str] = None
-    ) -> str:
+    def _get_profile_context(self, student_id: int) -> List[str]:
         """
-        Build memory context for the system prompt.
-
-        Args:
-            student_id: The student's ID
-            include_reference: Whether to include a memory reference
-            current_topic: Current topic being discussed
-            current_input: Current user input
+        Get the known-information lines of the memory context.
 
-        Returns:
-            Memory context string for prompt
+        These depend only on the stored profile, so they are rebuilt only
+        after the profile changes instead of on every message.
         """
+        version = self.memory_store.profile_version(student_id)
+        cached = self._profile_context_cache.get(student_id)
+        if cached and cached[0] == version:
+            return cached[1]
+
         profile_summary = self.memory_store.get_profile_summary(student_id)
 
         context_parts = []
@@ -222,6 +212,30 @@ class MemoryReferencer:
             careers_str = ", ".join(profile_summary["careers_discussed"][:5])
             context_parts.append(f"Careers previously discussed: {careers_str}")
 
+        self._profile_context_cache[student_id] = (version, context_parts)
+        return context_parts
+
+    def build_memory_context(
+        self,
+        student_id: int,
+        include_reference: bool = False,
+        current_topic: Optional[str] = None,
+        current_input: Optional[str] = None
+    ) -> str:
+        """
+        Build memory context for the system prompt.
+
+        Args:
+            student_id: The student's ID
+            include_reference: Whether to include a memory reference
+            current_topic: Current topic being discussed
+            current_input: Current user input
+
+        Returns:
+            Memory context string for prompt
+        """
+        context_parts = list(self._get_profile_context(student_id))
+
         # Add reference instruction if applicable
         if include_reference:
             reference = self.get_relevant_reference(student_id, current_topic, current_input)
@@ -2,12 +2,14 @@
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, ForeignKey, Float
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 
+from db import enable_sqlite_pragmas
+
 logger = logging.getLogger(__name__)
 
 Base = declarative_base()
@@ -94,6 +96,10 @@ class ConversationMemory(Base):
     profile = relationship("StudentProfile", back_populates="memories")
 
 
+# Profile list fields that extractions are merged into
+PROFILE_FIELDS = ("interests", "dislikes", "strengths", "challenges", "career_mentions")
+
+
 class MemoryStore:
     """Handles storage and retrieval of student memories"""
 
@@ -105,11 +111,38 @@ class MemoryStore:
             db_path: Path to SQLite database
         """
         self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        enable_sqlite_pragmas(self.engine)
         Base.metadata.create_all(self.engine)
 
         Session = sessionmaker(bind=self.engine)
         self.session = Session()
 
+        # Bumped whenever a student's profile changes, so readers can cache
+        # anything derived from it
+        self._profile_versions: Dict[int, int] = {}
+
+    def profile_version(self, student_id: int) -> int:
+        """Get a counter that changes whenever the student's profile is updated"""
+        return self._profile_versions.get(student_id, 0)
+
+    def _get_or_create_profile(self, student_id: int) -> Tuple[StudentProfile, bool]:
+        """
+        Look up a profile, adding a new one to the session if none exists.
+
+        Nothing is committed here, so callers can fold the creation into
+        their own transaction.
+
+        Returns:
+            Tuple of (profile, created)
+        """
+        profile = self.session.query(StudentProfile).filter_by(student_id=student_id).first()
+        if profile:
+            return profile, False
+
+        profile = StudentProfile(student_id=student_id)
+        self.session.add(profile)
+        return profile, True
+
     def get_or_create_profile(self, student_id: int) -> StudentProfile:
         """
         Get or create a student profile.
@@ -120,11 +153,9 @@ class MemoryStore:
         Returns:
             StudentProfile object
         """
-        profile = self.session.query(StudentProfile).filter_by(student_id=student_id).first()
+        profile, created = self._get_or_create_profile(student_id)
 
-        if not profile:
-            profile = StudentProfile(student_id=student_id)
-            self.session.add(profile)
+        if created:
             self.session.commit()
             logger.info(f"Created new profile for student {student_id}")
 
@@ -138,6 +169,10 @@ class MemoryStore:
         """
         Update a student's profile with new extractions.
 
+        Creating the profile (if needed) and merging every category happen
+        in a single transaction, and nothing is written when there is
+        nothing to merge.
+
         Args:
             student_id: The student's ID
             extractions: Dict with interests, dislikes, strengths, challenges, career_mentions
@@ -145,31 +180,19 @@ class MemoryStore:
         Returns:
             Updated StudentProfile
         """
-        profile = self.get_or_create_profile(student_id)
+        profile, changed = self._get_or_create_profile(student_id)
 
         # Merge new data with existing
-        if extractions.get("interests"):
-            existing = profile.interests
-            profile.interests = self._merge_items(existing, extractions["interests"])
-
-        if extractions.get("dislikes"):
-            existing = profile.dislikes
-            profile.dislikes = self._merge_items(existing, extractions["dislikes"])
+        for field in PROFILE_FIELDS:
+            new_items = extractions.get(field)
+            if new_items:
+                setattr(profile, field, self._merge_items(getattr(profile, field), new_items))
+                changed = True
 
-        if extractions.get("strengths"):
-            existing = profile.strengths
-            profile.strengths = self._merge_items(existing, extractions["strengths"])
-
-        if extractions.get("challenges"):
-            existing = profile.challenges
-            profile.challenges = self._merge_items(existing, extractions["challenges"])
-
-        if extractions.get("career_mentions"):
-            existing = profile.career_mentions
-            profile.career_mentions = self._merge_items(existing, extractions["career_mentions"])
-
-        self.session.commit()
-        logger.info(f"Updated profile for student {student_id}")
+        if changed:
+            self.session.commit()
+            self._profile_versions[student_id] = self.profile_version(student_id) + 1
+            logger.info(f"Updated profile for student {student_id}")
 
         return profile
 
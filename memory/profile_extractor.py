@@ -19,12 +19,15 @@ class ProfileExtractor:
     - Career interests (careers they've shown interest in)
     """
 
+    # Captures anchored only by a trailing literal are bounded to a single
+    # clause so pathological input can't trigger catastrophic backtracking.
+
     # Patterns for extracting interests
     INTEREST_PATTERNS = [
         (r"i (?:really )?(?:like|love|enjoy) (?:to )?(.+?)(?:\.|,|$|!)", "interest"),
         (r"i'm (?:really )?interested in (.+?)(?:\.|,|$|!)", "interest"),
-        (r"i find (.+?) (?:interesting|fascinating|exciting)", "interest"),
-        (r"(.+?) is (?:really )?(?:fun|interesting|exciting) (?:to me|for me)?", "interest"),
+        (r"i find ([^.!?,]{1,80}?) (?:interesting|fascinating|exciting)", "interest"),
+        (r"([^.!?,]{1,80}?) is (?:really )?(?:fun|interesting|exciting) (?:to me|for me)?", "interest"),
         (r"i've always (?:liked|loved|enjoyed) (.+?)(?:\.|,|$|!)", "interest"),
     ]
 
@@ -32,7 +35,7 @@ class ProfileExtractor:
     DISLIKE_PATTERNS = [
         (r"i (?:really )?(?:hate|dislike|don't like) (.+?)(?:\.|,|$|!)", "dislike"),
         (r"i'm not (?:really )?interested in (.+?)(?:\.|,|$|!)", "dislike"),
-        (r"(.+?) is (?:boring|dull|not for me)", "dislike"),
+        (r"([^.!?,]{1,80}?) is (?:boring|dull|not for me)", "dislike"),
         (r"i (?:can't stand|avoid) (.+?)(?:\.|,|$|!)", "dislike"),
     ]
 
@@ -49,8 +52,8 @@ class ProfileExtractor:
     CHALLENGE_PATTERNS = [
         (r"i'm (?:not (?:really )?)?(?:bad|weak) at (.+?)(?:\.|,|$|!)", "challenge"),
         (r"i struggle with (.+?)(?:\.|,|$|!)", "challenge"),
-        (r"(.+?) is (?:difficult|hard|challenging) for me", "challenge"),
-        (r"i (?:can't|cannot) (?:do|handle) (.+?) well", "challenge"),
+        (r"([^.!?,]{1,80}?) is (?:difficult|hard|challenging) for me", "challenge"),
+        (r"i (?:can't|cannot) (?:do|handle) ([^.!?,]{1,80}?) well", "challenge"),
     ]
 
     # Career-related keywords
@@ -61,15 +64,74 @@ class ProfileExtractor:
         "entrepreneur", "psychologist", "journalist", "photographer",
         "software", "marketing", "finance", "medicine", "law", "business"
     ]
+    CAREER_KEYWORDS_SET = frozenset(CAREER_KEYWORDS)
+
+    # Single alternation over the keywords, longest first so "lawyer" wins
+    # over "law". Only the start is word-bounded so that "law" can't fire
+    # inside "outlaw" while "engineering" still counts as "engineer".
+    _CAREER_RE = re.compile(
+        r"\b(?:" + "|".join(map(re.escape, sorted(CAREER_KEYWORDS, key=len, reverse=True))) + ")"
+    )
+
+    # Filler words stripped from the start of an extraction
+    _LEADING_FILLERS_RE = re.compile(
+        r"^(?:(?:to|the|a|an|doing|being|that|this)(?:\s+|$))+",
+        re.IGNORECASE
+    )
+
+    # Keywords at least one of which every pattern of a category needs to
+    # match, mapped to the categories they can unlock. One scan for these
+    # decides which pattern groups are worth running at all.
+    CATEGORY_TRIGGERS = {
+        "like": ("interest", "dislike"),
+        "love": ("interest",),
+        "enjoy": ("interest",),
+        "interest": ("interest", "dislike"),
+        "fascinating": ("interest",),
+        "exciting": ("interest",),
+        "fun": ("interest",),
+        "hate": ("dislike",),
+        "boring": ("dislike",),
+        "dull": ("dislike",),
+        "not for me": ("dislike",),
+        "can't stand": ("dislike",),
+        "avoid": ("dislike",),
+        "good at": ("strength",),
+        "skilled": ("strength",),
+        "do well": ("strength",),
+        "strength": ("strength",),
+        "strong point": ("strength",),
+        "bad at": ("challenge",),
+        "weak at": ("challenge",),
+        "struggle": ("challenge",),
+        "difficult": ("challenge",),
+        "hard": ("challenge",),
+        "challenging": ("challenge",),
+        "can't": ("challenge",),
+        "cannot": ("challenge",),
+    }
+
+    # The lookahead lets matches overlap, so every trigger present is
+    # found even when one runs into the next
+    _TRIGGER_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, sorted(CATEGORY_TRIGGERS, key=len, reverse=True))) + "))"
+    )
+
+    # Every pattern compiled once per process, grouped by category along
+    # with the extractions key it fills. They are written in lowercase and
+    # matched against the lowercased message, so no IGNORECASE is needed.
+    _COMPILED_PATTERNS = {
+        category: (key, [(re.compile(p[0]), p[1]) for p in patterns])
+        for category, key, patterns in (
+            ("interest", "interests", INTEREST_PATTERNS),
+            ("dislike", "dislikes", DISLIKE_PATTERNS),
+            ("strength", "strengths", STRENGTH_PATTERNS),
+            ("challenge", "challenges", CHALLENGE_PATTERNS),
+        )
+    }
 
     def __init__(self):
-        # Compile all patterns
-        self.compiled_patterns = {
-            "interest": [(re.compile(p[0], re.IGNORECASE), p[1]) for p in self.INTEREST_PATTERNS],
-            "dislike": [(re.compile(p[0], re.IGNORECASE), p[1]) for p in self.DISLIKE_PATTERNS],
-            "strength": [(re.compile(p[0], re.IGNORECASE), p[1]) for p in self.STRENGTH_PATTERNS],
-            "challenge": [(re.compile(p[0], re.IGNORECASE), p[1]) for p in self.CHALLENGE_PATTERNS],
-        }
+        self.compiled_patterns = self._COMPILED_PATTERNS
 
     def extract_from_message(self, message: str) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -91,44 +153,52 @@ class ProfileExtractor:
 
         message_lower = message.lower()
 
+        # Only run the pattern groups whose trigger keywords appear
+        triggered = {
+            category
+            for trigger in self._TRIGGER_RE.findall(message_lower)
+            for category in self.CATEGORY_TRIGGERS[trigger]
+        }
+
+        # Every item from this message shares one timestamp
+        extracted_at = datetime.now().isoformat()
+
         # Extract using patterns
-        for category, patterns in self.compiled_patterns.items():
+        for category, (key, patterns) in self.compiled_patterns.items():
+            if category not in triggered:
+                continue
             for pattern, _ in patterns:
-                matches = pattern.findall(message)
-                for match in matches:
+                for match in pattern.findall(message_lower):
                     cleaned = self._clean_extraction(match)
                     if cleaned and len(cleaned) > 2:  # Avoid very short matches
-                        key = f"{category}s" if category != "challenge" else "challenges"
-                        if category == "interest":
-                            key = "interests"
-                        elif category == "dislike":
-                            key = "dislikes"
-                        elif category == "strength":
-                            key = "strengths"
-
                         extractions[key].append({
                             "content": cleaned,
                             "confidence": 0.8,
-                            "extracted_at": datetime.now().isoformat()
+                            "extracted_at": extracted_at
                         })
 
         # Extract career mentions
-        for keyword in self.CAREER_KEYWORDS:
-            if keyword in message_lower:
-                # Check context to determine interest level
-                context_window = 50
-                idx = message_lower.find(keyword)
-                context = message_lower[max(0, idx-context_window):min(len(message_lower), idx+context_window)]
-
-                # Determine if it's positive, negative, or neutral mention
-                sentiment = self._determine_career_sentiment(context, keyword)
-
-                extractions["career_mentions"].append({
-                    "career": keyword,
-                    "sentiment": sentiment,
-                    "context": message[max(0, idx-30):min(len(message), idx+30)],
-                    "extracted_at": datetime.now().isoformat()
-                })
+        seen_careers = set()
+        for career_match in self._CAREER_RE.finditer(message_lower):
+            keyword = career_match.group()
+            if keyword in seen_careers:
+                continue
+            seen_careers.add(keyword)
+
+            # Check context to determine interest level
+            context_window = 50
+            idx = career_match.start()
+            context = message_lower[max(0, idx-context_window):min(len(message_lower), idx+context_window)]
+
+            # Determine if it's positive, negative, or neutral mention
+            sentiment = self._determine_career_sentiment(context, keyword)
+
+            extractions["career_mentions"].append({
+                "career": keyword,
+                "sentiment": sentiment,
+                "context": message[max(0, idx-30):min(len(message), idx+30)],
+                "extracted_at": extracted_at
+            })
 
         return extractions
 
@@ -155,16 +225,22 @@ class ProfileExtractor:
             "career_mentions": []
         }
 
+        # Retries and edits often repeat a message verbatim; skip those
+        seen_contents = set()
+
         for msg in messages:
             if student_only and msg.get("role") != "user":
                 continue
 
-            content = msg.get("content", "")
-            if content:
-                extractions = self.extract_from_message(content)
+            content = msg.get("content", "").strip()
+            if not content or content in seen_contents:
+                continue
+            seen_contents.add(content)
+
+            extractions = self.extract_from_message(content)
 
-                for key in all_extractions:
-                    all_extractions[key].extend(extractions[key])
+            for key in all_extractions:
+                all_extractions[key].extend(extractions[key])
 
         # Deduplicate while keeping highest confidence
         for key in all_extractions:
@@ -177,13 +253,9 @@ class ProfileExtractor:
         if isinstance(text, tuple):
             text = text[0] if text else ""
 
-        # Remove common filler words at start
-        fillers = ["to", "the", "a", "an", "doing", "being", "that", "this"]
-        words = text.strip().split()
-        while words and words[0].lower() in fillers:
-            words.pop(0)
-
-        return " ".join(words).strip()
+        # Collapse whitespace runs so spacing variants dedupe together,
+        # then remove common filler words at start
+        return self._LEADING_FILLERS_RE.sub("", " ".join(text.split()))
 
     def _determine_career_sentiment(self, context: str, career: str) -> str:
         """Determine sentiment about a career mention"""
@@ -238,3 +310,7 @@ class ProfileExtractor:
             merged[key] = self._deduplicate(combined)
 
         return merged
+
+
+# Shared instance; the extractor holds no per-message state
+profile_extractor = ProfileExtractor()
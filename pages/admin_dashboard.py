@@ -1,12 +1,10 @@
 """Admin dashboard page for Buddy AI - Figma Design Match"""
 import streamlit as st
 from pathlib import Path
-import sys
 from datetime import datetime
 
-# Add parent directory to path for imports
+# Project root, for data paths. Streamlit already puts it on sys.path.
 parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
 
 from admin.analytics import AnalyticsEngine
 from admin.privacy_filter import PrivacyFilter
@@ -379,7 +377,7 @@ st.markdown("""
 total_chats = dashboard_data.get('total_conversations', 0)
 total_messages = dashboard_data.get('total_messages', 0)
 dau = dashboard_data.get('daily_active_users', {})
-estimated_users = list(dau.values())[0] if dau else 0
+estimated_users = next(iter(dau.values()), 0)
 rag_status = "Connected" if st.session_state.get('rag_status', 'offline') == 'connected' else "Offline"
 
 st.markdown(f"""
@@ -492,10 +490,10 @@ with col1:
     dau_data = dashboard_data.get('daily_active_users', {})
     if dau_data:
         import pandas as pd
-        df = pd.DataFrame([
-            {"Date": date, "Conversations": count}
-            for date, count in dau_data.items()
-        ])
+        df = pd.DataFrame({
+            "Date": list(dau_data.keys()),
+            "Conversations": list(dau_data.values())
+        })
         st.bar_chart(df.set_index("Date"))
     else:
         st.info("No activity data available yet.")
@@ -538,10 +536,10 @@ with col3:
     topics = dashboard_data.get('topic_distribution', {})
     if topics:
         import pandas as pd
-        df = pd.DataFrame([
-            {"Topic": topic.replace("_", " ").title(), "Count": count}
-            for topic, count in topics.items()
-        ])
+        df = pd.DataFrame({
+            "Topic": [topic.replace("_", " ").title() for topic in topics],
+            "Count": list(topics.values())
+        })
         st.bar_chart(df.set_index("Topic"))
     else:
         st.info("No topic data available yet.")
@@ -1,13 +1,10 @@
 """Forgot password page for Buddy AI"""
 import streamlit as st
-from pathlib import Path
-import sys
 
-# Add parent directory to path for imports
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
-
-from auth import AuthHandler
+# Streamlit puts the app directory on sys.path, so project packages
+# import directly
+from ui.auth_cache import get_auth_handler
+from ui.styles import inject_auth_styles
 
 # Page config
 st.set_page_config(
@@ -17,135 +14,18 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Initialize auth handler
-@st.cache_resource
-def get_auth_handler():
-    return AuthHandler(db_path=str(parent_dir / "data" / "buddy_ai.db"))
-
+# Initialize auth handler (shared with the other auth pages)
 auth_handler = get_auth_handler()
 
 # Custom CSS matching the main app style
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Lora:wght@400;500;600;700&family=Inter:wght@400;500;600&display=swap');
-
-    #MainMenu, footer, header {display: none !important;}
-    .stDeployButton {display: none !important;}
-    [data-testid="stSidebar"] {display: none !important;}
-    [data-testid="collapsedControl"] {display: none !important;}
-
-    .stApp {
-        background: #F3F4F6 !important;
-    }
-
-    .reset-container {
-        max-width: 400px;
-        margin: 60px auto;
-        padding: 40px;
-        background: white;
-        border-radius: 16px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-    }
-
-    .reset-header {
-        text-align: center;
-        margin-bottom: 30px;
-    }
-
-    .reset-logo {
-        font-size: 3rem;
-        margin-bottom: 12px;
-    }
-
-    .reset-title {
-        font-family: 'Lora', serif !important;
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: #004aad;
-        margin-bottom: 8px;
-    }
-
-    .reset-subtitle {
-        font-family: 'Inter', sans-serif;
-        color: #6B7280;
-        font-size: 0.95rem;
-    }
-
-    .stTextInput > div > div > input {
-        border-radius: 10px !important;
-        border: 1px solid #E5E7EB !important;
-        padding: 12px 16px !important;
-        font-size: 1rem !important;
-    }
-
-    .stTextInput > div > div > input:focus {
-        border-color: #004aad !important;
-        box-shadow: 0 0 0 3px rgba(0, 74, 173, 0.1) !important;
-    }
-
-    .stButton > button {
-        width: 100%;
-        background: #004aad !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 10px !important;
-        padding: 12px 24px !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        margin-top: 10px !important;
-    }
-
-    .stButton > button:hover {
-        background: #003a8c !important;
-    }
-
-    .link-text {
-        text-align: center;
-        margin-top: 20px;
-        font-size: 0.9rem;
-        color: #6B7280;
-    }
-
-    .error-message {
-        background: #FEE2E2;
-        color: #991B1B;
-        padding: 12px 16px;
-        border-radius: 8px;
-        margin-bottom: 16px;
-        font-size: 0.9rem;
-    }
-
-    .success-message {
-        background: #D1FAE5;
-        color: #065F46;
-        padding: 12px 16px;
-        border-radius: 8px;
-        margin-bottom: 16px;
-        font-size: 0.9rem;
-    }
-
-    .info-message {
-        background: #DBEAFE;
-        color: #1E40AF;
-        padding: 12px 16px;
-        border-radius: 8px;
-        margin-bottom: 16px;
-        font-size: 0.9rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_auth_styles()
 
 # Initialize session state
-if "reset_step" not in st.session_state:
-    st.session_state.reset_step = "email"  # email, token, new_password
-if "reset_email" not in st.session_state:
-    st.session_state.reset_email = ""
-if "reset_token" not in st.session_state:
-    st.session_state.reset_token = ""
-if "reset_message" not in st.session_state:
-    st.session_state.reset_message = None
-if "reset_message_type" not in st.session_state:
-    st.session_state.reset_message_type = None
+st.session_state.setdefault("reset_step", "email")  # email, token, new_password
+st.session_state.setdefault("reset_email", "")
+st.session_state.setdefault("reset_token", "")
+st.session_state.setdefault("reset_message", None)
+st.session_state.setdefault("reset_message_type", None)
 
 # Reset container
 st.markdown('<div class="reset-container">', unsafe_allow_html=True)
@@ -227,11 +107,13 @@ elif st.session_state.reset_step == "new_password":
                 success, message = auth_handler.reset_password(st.session_state.reset_token, new_password)
 
                 if success:
-                    st.session_state.reset_step = "email"
-                    st.session_state.reset_email = ""
-                    st.session_state.reset_token = ""
-                    st.session_state.reset_message = "Password reset successful! You can now login."
-                    st.session_state.reset_message_type = "success"
+                    st.session_state.update({
+                        "reset_step": "email",
+                        "reset_email": "",
+                        "reset_token": "",
+                        "reset_message": "Password reset successful! You can now login.",
+                        "reset_message_type": "success",
+                    })
                 else:
                     st.session_state.reset_message = message
                     st.session_state.reset_message_type = "error"
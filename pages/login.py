@@ -1,25 +1,11 @@
 """Login page for Buddy AI"""
 import streamlit as st
-from pathlib import Path
-import sys
-import os
-
-# Add parent directory to path for imports
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
-
-from auth import AuthHandler
-
-
-def get_secret(key: str, default: str = None) -> str:
-    """Get secret from Streamlit secrets or environment variables"""
-    try:
-        if hasattr(st, 'secrets') and key in st.secrets:
-            return st.secrets[key]
-    except Exception:
-        pass
-    return os.getenv(key, default)
+from datetime import datetime
 
+# Streamlit puts the app directory on sys.path, so project packages
+# import directly
+from ui.auth_cache import get_auth_handler
+from ui.styles import inject_auth_styles
 
 # Page config
 st.set_page_config(
@@ -29,147 +15,25 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Initialize auth handler
-@st.cache_resource
-def get_auth_handler():
-    jwt_secret = get_secret("JWT_SECRET_KEY")
-    return AuthHandler(
-        db_path=str(parent_dir / "data" / "buddy_ai.db"),
-        secret_key=jwt_secret
-    )
-
+# Initialize auth handler (shared with the other auth pages)
 auth_handler = get_auth_handler()
 
+
+# Retyping the same address skips the database lookup; the short TTL
+# keeps registration changes made elsewhere visible
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_check(email: str) -> dict:
+    return get_auth_handler().check_email_status(email)
+
+
 # Custom CSS matching the main app style
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Lora:wght@400;500;600;700&family=Inter:wght@400;500;600&display=swap');
-
-    #MainMenu, footer, header {display: none !important;}
-    .stDeployButton {display: none !important;}
-    [data-testid="stSidebar"] {display: none !important;}
-    [data-testid="collapsedControl"] {display: none !important;}
-
-    .stApp {
-        background: #F3F4F6 !important;
-    }
-
-    .login-container {
-        max-width: 400px;
-        margin: 60px auto;
-        padding: 40px;
-        background: white;
-        border-radius: 16px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-    }
-
-    .login-header {
-        text-align: center;
-        margin-bottom: 30px;
-    }
-
-    .login-logo {
-        font-size: 3rem;
-        margin-bottom: 12px;
-    }
-
-    .login-title {
-        font-family: 'Lora', serif !important;
-        font-size: 1.8rem;
-        font-weight: 600;
-        color: #004aad;
-        margin-bottom: 8px;
-    }
-
-    .login-subtitle {
-        font-family: 'Inter', sans-serif;
-        color: #6B7280;
-        font-size: 0.95rem;
-    }
-
-    .stTextInput > div > div > input {
-        border-radius: 10px !important;
-        border: 1px solid #E5E7EB !important;
-        padding: 12px 16px !important;
-        font-size: 1rem !important;
-    }
-
-    .stTextInput > div > div > input:focus {
-        border-color: #004aad !important;
-        box-shadow: 0 0 0 3px rgba(0, 74, 173, 0.1) !important;
-    }
-
-    .stButton > button {
-        width: 100%;
-        background: #004aad !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 10px !important;
-        padding: 12px 24px !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        margin-top: 10px !important;
-    }
-
-    .stButton > button:hover {
-        background: #003a8c !important;
-    }
-
-    .link-text {
-        text-align: center;
-        margin-top: 20px;
-        font-size: 0.9rem;
-        color: #6B7280;
-    }
-
-    .link-text a {
-        color: #004aad;
-        text-decoration: none;
-        font-weight: 500;
-    }
-
-    .link-text a:hover {
-        text-decoration: underline;
-    }
-
-    .error-message {
-        background: #FEE2E2;
-        color: #991B1B;
-        padding: 12px 16px;
-        border-radius: 8px;
-        margin-bottom: 16px;
-        font-size: 0.9rem;
-    }
-
-    .success-message {
-        background: #D1FAE5;
-        color: #065F46;
-        padding: 12px 16px;
-        border-radius: 8px;
-        margin-bottom: 16px;
-        font-size: 0.9rem;
-    }
-
-    .info-message {
-        background: #DBEAFE;
-        color: #1E40AF;
-        padding: 12px 16px;
-        border-radius: 8px;
-        margin-bottom: 16px;
-        font-size: 0.9rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_auth_styles()
 
 # Initialize session state
-if "login_step" not in st.session_state:
-    st.session_state.login_step = "email"  # email, password, setup_password
-if "login_email" not in st.session_state:
-    st.session_state.login_email = ""
-if "login_message" not in st.session_state:
-    st.session_state.login_message = None
-if "login_message_type" not in st.session_state:
-    st.session_state.login_message_type = None
+st.session_state.setdefault("login_step", "email")  # email, password, setup_password
+st.session_state.setdefault("login_email", "")
+st.session_state.setdefault("login_message", None)
+st.session_state.setdefault("login_message_type", None)
 
 # Check if already logged in
 if st.session_state.get("authenticated"):
@@ -204,7 +68,7 @@ if st.session_state.login_step == "email":
     if st.button("Continue", key="continue_btn"):
         if email:
             email = email.strip().lower()
-            status = auth_handler.check_email_status(email)
+            status = _cached_check(email)
 
             if not status["valid_domain"]:
                 st.session_state.login_message = status["message"]
@@ -243,24 +107,29 @@ elif st.session_state.login_step == "password":
                 success, message, token = auth_handler.login(st.session_state.login_email, password)
 
                 if success:
-                    from datetime import datetime
                     # Store session
-                    st.session_state.authenticated = True
-                    st.session_state.session_token = token
-                    st.session_state.user_email = st.session_state.login_email
-                    st.session_state.session_created_at = datetime.now().isoformat()
+                    st.session_state.update({
+                        "authenticated": True,
+                        "session_token": token,
+                        "user_email": st.session_state.login_email,
+                        "session_created_at": datetime.now().isoformat(),
+                    })
 
                     # Get user info
                     user_info = auth_handler.validate_session(token)
                     if user_info:
-                        st.session_state.student_id = user_info["student_id"]
-                        st.session_state.school_id = user_info["school_id"]
-                        st.session_state.grade = user_info["grade"]
+                        st.session_state.update({
+                            "student_id": user_info["student_id"],
+                            "school_id": user_info["school_id"],
+                            "grade": user_info["grade"],
+                        })
 
                     # Clear login state
-                    st.session_state.login_step = "email"
-                    st.session_state.login_email = ""
-                    st.session_state.login_message = None
+                    st.session_state.update({
+                        "login_step": "email",
+                        "login_email": "",
+                        "login_message": None,
+                    })
 
                     st.switch_page("app.py")
                 else:
@@ -300,24 +169,32 @@ elif st.session_state.login_step == "setup_password":
                 success, message, token = auth_handler.setup_password(st.session_state.login_email, password)
 
                 if success:
-                    from datetime import datetime
+                    # The cached status still says no password is set
+                    _cached_check.clear()
+
                     # Store session
-                    st.session_state.authenticated = True
-                    st.session_state.session_token = token
-                    st.session_state.user_email = st.session_state.login_email
-                    st.session_state.session_created_at = datetime.now().isoformat()
+                    st.session_state.update({
+                        "authenticated": True,
+                        "session_token": token,
+                        "user_email": st.session_state.login_email,
+                        "session_created_at": datetime.now().isoformat(),
+                    })
 
                     # Get user info
                     user_info = auth_handler.validate_session(token)
                     if user_info:
-                        st.session_state.student_id = user_info["student_id"]
-                        st.session_state.school_id = user_info["school_id"]
-                        st.session_state.grade = user_info["grade"]
+                        st.session_state.update({
+                            "student_id": user_info["student_id"],
+                            "school_id": user_info["school_id"],
+                            "grade": user_info["grade"],
+                        })
 
                     # Clear login state
-                    st.session_state.login_step = "email"
-                    st.session_state.login_email = ""
-                    st.session_state.login_message = None
+                    st.session_state.update({
+                        "login_step": "email",
+                        "login_email": "",
+                        "login_message": None,
+                    })
 
                     st.switch_page("app.py")
                 else:
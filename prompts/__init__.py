@@ -1,11 +1,13 @@
 """Prompt system for Buddy AI"""
-from .system_prompt import SystemPrompt, get_system_prompt
+from .system_prompt import SystemPrompt, get_system_prompt, get_system_prompt_tokens
 from .state_prompts import StatePrompts
-from .guardrails import ResponseGuardrails
+from .guardrails import ResponseGuardrails, guardrails
 
 __all__ = [
     'SystemPrompt',
     'get_system_prompt',
+    'get_system_prompt_tokens',
     'StatePrompts',
-    'ResponseGuardrails'
+    'ResponseGuardrails',
+    'guardrails'
 ]
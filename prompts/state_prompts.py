@@ -1,14 +1,13 @@
 """State-specific prompt templates for Buddy AI"""
-from typing import Dict, Any, Optional
+import re
+import textwrap
+from typing import Dict, Any, Final, Optional
 from conversation.constants import ConversationState
 
 
-class StatePrompts:
-    """Manages state-specific prompt templates and instructions"""
-
-    # State-specific prompt templates
-    TEMPLATES = {
-        ConversationState.GREETING: """
+# State-specific prompt templates (trimmed below, once at import)
+TEMPLATES = {
+    ConversationState.GREETING: """
 The student is greeting you. Respond warmly like an older sibling would.
 
 Your response should:
@@ -20,7 +19,7 @@ Your response should:
 Example tone: "Hey! Good to see you. I'm here to chat about careers, future plans, or whatever's on your mind. What's up?"
 """,
 
-        ConversationState.CONFUSED: """
+    ConversationState.CONFUSED: """
 The student is feeling confused or overwhelmed about their future/career choices.
 
 Your response should:
@@ -37,7 +36,7 @@ DO NOT:
 - Overwhelm them with questions
 """,
 
-        ConversationState.VALIDATION_SEEKING: """
+    ConversationState.VALIDATION_SEEKING: """
 The student is seeking approval or validation (e.g., "Can I become...", "Am I good enough...")
 
 Your response should:
@@ -54,7 +53,7 @@ DO NOT:
 - Predict their success or failure
 """,
 
-        ConversationState.SELF_REFLECTION: """
+    ConversationState.SELF_REFLECTION: """
 The student is sharing something about themselves - their interests, dislikes, or self-perception.
 
 Your response should:
@@ -68,7 +67,7 @@ Example tone: "That's interesting that you enjoy [what they said]. I'd love to u
 This is a moment to build trust by showing genuine interest in THEM, not in matching them to careers.
 """,
 
-        ConversationState.CAREER_CURIOSITY: """
+    ConversationState.CAREER_CURIOSITY: """
 The student is curious about a specific career or profession.
 
 Your response should:
@@ -85,7 +84,7 @@ DO NOT:
 - Overwhelm with statistics
 """,
 
-        ConversationState.COMPARISON: """
+    ConversationState.COMPARISON: """
 The student is comparing two or more career/stream options.
 
 Your response should:
@@ -102,7 +101,7 @@ DO NOT:
 - Make judgments about difficulty
 """,
 
-        ConversationState.INFORMATION_SEEKING: """
+    ConversationState.INFORMATION_SEEKING: """
 The student wants factual information (exams, fees, colleges, eligibility, etc.)
 
 Your response should:
@@ -119,7 +118,7 @@ DO NOT:
 - Push them toward decisions
 """,
 
-        ConversationState.OUT_OF_SCOPE: """
+    ConversationState.OUT_OF_SCOPE: """
 The student has asked about something outside your scope (mental health, relationships, politics, etc.)
 
 You MUST use this EXACT response (word for word):
@@ -135,50 +134,81 @@ DO NOT:
 - Explain why you can't help
 - Offer alternative advice
 """
-    }
-
-    def get_state_prompt(self, state: ConversationState) -> str:
-        """
-        Get the prompt template for a specific state.
-
-        Args:
-            state: The conversation state
-
-        Returns:
-            The prompt template string
-        """
-        return self.TEMPLATES.get(state, self.TEMPLATES[ConversationState.CAREER_CURIOSITY])
-
-    def build_state_context(
-        self,
-        state: ConversationState,
-        user_input: str,
-        additional_context: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """
-        Build the complete state context for the LLM.
-
-        Args:
-            state: The detected conversation state
-            user_input: The student's message
-            additional_context: Any additional context (e.g., comparison options)
-
-        Returns:
-            Complete state context string
-        """
-        template = self.get_state_prompt(state)
-
-        context_parts = [
-            f"STUDENT'S MESSAGE: {user_input}",
-            "",
-            "STATE-SPECIFIC INSTRUCTIONS:",
-            template
-        ]
-
-        if additional_context:
-            context_parts.append("")
-            context_parts.append("ADDITIONAL CONTEXT:")
-            for key, value in additional_context.items():
-                context_parts.append(f"- {key}: {value}")
-
-        return "\n".join(context_parts)
+}
+
+
+def _trim_template(template: str) -> str:
+    """Drop indentation, trailing spaces and extra blank lines from a template"""
+    text = textwrap.dedent(template)
+    text = re.sub(r"[ \t]+$", "", text, flags=re.MULTILINE)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+# Trimmed once at import; every character here is sent to the LLM each turn
+TEMPLATES = {state: _trim_template(template) for state, template in TEMPLATES.items()}
+
+# Template for any state without its own, resolved once
+_DEFAULT_TEMPLATE: Final = TEMPLATES[ConversationState.CAREER_CURIOSITY]
+
+# Templates indexed by state value. auto() numbers the states from 1 in
+# definition order, so a lookup is a single tuple index with no fallback.
+_TEMPLATES_BY_VALUE: Final = tuple(
+    TEMPLATES.get(state, _DEFAULT_TEMPLATE) for state in ConversationState
+)
+
+# Everything after the student's message is fixed per state, so
+# build_state_context only has to prepend the message
+_CONTEXT_SUFFIXES: Final = tuple(
+    f"\n\nSTATE-SPECIFIC INSTRUCTIONS:\n{template}" for template in _TEMPLATES_BY_VALUE
+)
+
+
+def get_state_prompt(state: ConversationState) -> str:
+    """
+    Get the prompt template for a specific state.
+
+    Args:
+        state: The conversation state
+
+    Returns:
+        The prompt template string
+    """
+    return _TEMPLATES_BY_VALUE[state.value - 1]
+
+
+def build_state_context(
+    state: ConversationState,
+    user_input: str,
+    additional_context: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Build the complete state context for the LLM.
+
+    Args:
+        state: The detected conversation state
+        user_input: The student's message
+        additional_context: Any additional context (e.g., comparison options)
+
+    Returns:
+        Complete state context string
+    """
+    context = f"STUDENT'S MESSAGE: {user_input}{_CONTEXT_SUFFIXES[state.value - 1]}"
+
+    if not additional_context:
+        return context
+
+    extra = "\n".join(f"- {key}: {value}" for key, value in additional_context.items())
+    return f"{context}\n\nADDITIONAL CONTEXT:\n{extra}"
+
+
+class StatePrompts:
+    """
+    Manages state-specific prompt templates and instructions.
+
+    Thin wrapper kept for existing callers; the module-level TEMPLATES,
+    get_state_prompt and build_state_context do the work.
+    """
+
+    TEMPLATES = TEMPLATES
+    get_state_prompt = staticmethod(get_state_prompt)
+    build_state_context = staticmethod(build_state_context)
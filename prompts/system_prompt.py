@@ -1,4 +1,10 @@
 """Core system prompt for Buddy AI - the warm elder sibling personality"""
+import io
+from functools import lru_cache
+from typing import Tuple
+
+from conversation.constants import ConversationState
+from .state_prompts import TEMPLATES
 
 CORE_SYSTEM_PROMPT = """You are Buddy AI, a warm and friendly career guide for students in grades 8-10 (ages 13-16).
 
@@ -110,6 +116,18 @@ When in doubt:
 This conversation works only when the student feels: "This understands me."
 """
 
+STATE_INSTRUCTIONS_HEADER = "\n## CURRENT STATE INSTRUCTIONS\n"
+MEMORY_CONTEXT_HEADER = "\n## WHAT YOU KNOW ABOUT THIS STUDENT\n"
+RAG_CONTEXT_HEADER = "\n## CAREER INFORMATION CONTEXT\n"
+
+# Core prompt + state template for every state, built once at import so each
+# turn in a given state starts from the very same string object
+_PREBUILT_PREFIXES = {
+    state: CORE_SYSTEM_PROMPT + "\n" + STATE_INSTRUCTIONS_HEADER + template
+    for state, template in TEMPLATES.items()
+}
+_DEFAULT_PREFIX = _PREBUILT_PREFIXES[ConversationState.CAREER_CURIOSITY]
+
 
 class SystemPrompt:
     """System prompt builder for Buddy AI"""
@@ -138,20 +156,107 @@ class SystemPrompt:
         Returns:
             Complete system prompt
         """
-        prompt_parts = [self.core_prompt]
+        # Most stable parts first: provider prompt caches only match on an
+        # identical prefix, so per-turn memory and RAG context go last.
+        # Sections are written straight into one buffer with constant headers.
+        buf = io.StringIO()
+        buf.write(self.core_prompt)
+
+        for header, content in (
+            (STATE_INSTRUCTIONS_HEADER, state_instructions),
+            (MEMORY_CONTEXT_HEADER, memory_context),
+            (RAG_CONTEXT_HEADER, rag_context),
+        ):
+            if content:
+                buf.write("\n")
+                buf.write(header)
+                buf.write(content)
+
+        return buf.getvalue()
+
+    def get_static_system_prompt(self, state: ConversationState) -> str:
+        """
+        Get the cacheable part of the system prompt for a state.
 
-        if memory_context:
-            prompt_parts.append(f"\n## WHAT YOU KNOW ABOUT THIS STUDENT\n{memory_context}")
+        Core prompt plus the state's template. Identical for every turn in
+        the same state, so provider prompt caches can reuse it.
 
-        if state_instructions:
-            prompt_parts.append(f"\n## CURRENT STATE INSTRUCTIONS\n{state_instructions}")
+        Args:
+            state: The conversation state
+
+        Returns:
+            Static system prompt
+        """
+        return _PREBUILT_PREFIXES.get(state, _DEFAULT_PREFIX)
+
+    def build_dynamic_context(self, memory_context: str = "", rag_context: str = "") -> str:
+        """
+        Build the per-turn context to send after the static system prompt.
+
+        Args:
+            memory_context: Memory/profile context about the student
+            rag_context: RAG context (career information)
+
+        Returns:
+            Context string, empty if there is nothing to add
+        """
+        context_parts = []
+
+        if memory_context:
+            context_parts.append(f"{MEMORY_CONTEXT_HEADER}{memory_context}")
 
         if rag_context:
-            prompt_parts.append(f"\n## CAREER INFORMATION CONTEXT\n{rag_context}")
+            context_parts.append(f"{RAG_CONTEXT_HEADER}{rag_context}")
+
+        return "\n".join(context_parts)
 
-        return "\n".join(prompt_parts)
+    def build_prompt_for_state(
+        self,
+        state: ConversationState,
+        memory_context: str = "",
+        rag_context: str = ""
+    ) -> str:
+        """
+        Build a complete system prompt from the prebuilt prefix for a state.
 
+        Same output as build_prompt_with_context with the state's template
+        as instructions, without re-concatenating the static part.
+
+        Args:
+            state: The conversation state
+            memory_context: Memory/profile context about the student
+            rag_context: RAG context (career information)
+
+        Returns:
+            Complete system prompt
+        """
+        prompt = self.get_static_system_prompt(state)
+        dynamic_context = self.build_dynamic_context(memory_context, rag_context)
+
+        if not dynamic_context:
+            return prompt
+
+        return f"{prompt}\n{dynamic_context}"
 
 def get_system_prompt() -> str:
     """Get the default system prompt"""
     return CORE_SYSTEM_PROMPT
+
+
+@lru_cache(maxsize=None)
+def get_system_prompt_tokens(encoding_name: str = "o200k_base") -> Tuple[int, ...]:
+    """
+    Get the token ids of the core system prompt.
+
+    Encoded on first use per encoding and cached, so token counting or
+    request building doesn't re-tokenize the static prompt every turn.
+
+    Args:
+        encoding_name: tiktoken encoding (o200k_base is used by gpt-4o models)
+
+    Returns:
+        Tuple of token ids
+    """
+    import tiktoken
+
+    return tuple(tiktoken.get_encoding(encoding_name).encode(CORE_SYSTEM_PROMPT))
@@ -4,23 +4,54 @@ Pytest configuration and fixtures for Buddy AI tests.
 import pytest
 import tempfile
 import os
+import shutil
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _fast_bcrypt():
+    """Hash passwords at bcrypt's minimum cost; tests don't need real strength."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("BCRYPT_ROUNDS", "4")
+        yield
+
+
+@pytest.fixture(scope="session")
+def _session_db():
+    """Build the memory schema once, in a template database file."""
+    from memory import MemoryStore
+
+    # temp_db only backs MemoryStore tests (auth tests use mem_db), so the
+    # template holds just the schema they use and no auth seed data
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "template.db")
+        store = MemoryStore(db_path=db_path)
+        store.close()
+        # Closing the last connection checkpoints the WAL into the file
+        store.engine.dispose()
+        yield db_path
+
+
 @pytest.fixture
-def temp_db():
+def temp_db(_session_db, tmp_path):
     """Create a temporary database file for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        yield f.name
-    # Cleanup
-    try:
-        os.unlink(f.name)
-    except OSError:
-        pass
+    # Every consumer opens its own engine on the path, so isolation comes
+    # from a fresh copy of the prebuilt template rather than re-running
+    # schema creation and seeding for each test
+    db_path = tmp_path / "test.db"
+    shutil.copyfile(_session_db, db_path)
+    yield str(db_path)
+
+
+@pytest.fixture(scope="session")
+def mem_db():
+    """SQLite in-memory database path, for tests that need no file on disk."""
+    return ":memory:"
 
 
 @pytest.fixture
@@ -30,30 +61,30 @@ def temp_data_dir():
         yield tmpdir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_messages():
-    """Sample chat messages for testing."""
-    return [
+    """Sample chat messages for testing (read-only, shared by all tests)."""
+    return tuple(MappingProxyType(message) for message in [
         {"role": "user", "content": "Hello!"},
         {"role": "assistant", "content": "Hi there! How can I help you today?"},
         {"role": "user", "content": "I want to know about engineering careers"},
         {"role": "assistant", "content": "Engineering is a great field! What aspects interest you?"},
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_student_profile():
-    """Sample student profile data for testing."""
-    return {
-        "interests": ["technology", "problem solving"],
-        "dislikes": ["memorization"],
-        "strengths": ["math", "logical thinking"],
-        "challenges": ["public speaking"],
-        "careers_discussed": [
-            {"career": "software engineer", "sentiment": "positive"},
-            {"career": "data scientist", "sentiment": "curious"},
-        ]
-    }
+    """Sample student profile data for testing (read-only, shared by all tests)."""
+    return MappingProxyType({
+        "interests": ("technology", "problem solving"),
+        "dislikes": ("memorization",),
+        "strengths": ("math", "logical thinking"),
+        "challenges": ("public speaking",),
+        "careers_discussed": (
+            MappingProxyType({"career": "software engineer", "sentiment": "positive"}),
+            MappingProxyType({"career": "data scientist", "sentiment": "curious"}),
+        )
+    })
 
 
 @pytest.fixture
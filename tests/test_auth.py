@@ -4,6 +4,50 @@ Tests for authentication system.
 import pytest
 
 
+@pytest.fixture(scope="module")
+def shared_auth_handler(mem_db):
+    """One AuthHandler for the whole module, on an in-memory database."""
+    from sqlalchemy import event
+    from auth import AuthHandler
+
+    handler = AuthHandler(db_path=mem_db)
+    handler.db_session.close()
+
+    # pysqlite opens transactions on its own and treats SAVEPOINT as a
+    # plain statement; let SQLAlchemy emit BEGIN so savepoints nest. An
+    # in-memory engine keeps a single connection, so switch that one over
+    # instead of reconnecting (which would lose the database).
+    with handler.engine.connect() as connection:
+        connection.connection.dbapi_connection.isolation_level = None
+
+    @event.listens_for(handler.engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    yield handler
+    handler.engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def registered_user(shared_auth_handler):
+    """Seed one student with a password set; returns (email, password)."""
+    # test@demo.school.com is already taken by the handler's demo seed
+    email, password = "student@demo.school.com", "SecurePass123"
+    shared_auth_handler.register_student(email, 9)
+    shared_auth_handler.setup_password(email, password)
+    # Reading attributes after the commit reopened a transaction; end it
+    # so per-test fixtures can begin their own on the shared connection
+    shared_auth_handler.db_session.close()
+    return email, password
+
+
+@pytest.fixture(scope="module")
+def shared_session_manager():
+    """One SessionManager for the whole module; it holds no per-test state."""
+    from auth.session_manager import SessionManager
+    return SessionManager()
+
+
 class TestValidators:
     """Tests for auth validators."""
 
@@ -69,10 +113,24 @@ class TestAuthHandler:
     """Tests for AuthHandler class."""
 
     @pytest.fixture
-    def auth_handler(self, temp_db):
-        """Create an AuthHandler with temporary database."""
-        from auth import AuthHandler
-        return AuthHandler(db_path=temp_db)
+    def auth_handler(self, shared_auth_handler):
+        """Shared AuthHandler whose changes are rolled back after each test."""
+        from sqlalchemy.orm import Session
+
+        module_session = shared_auth_handler.db_session
+        connection = shared_auth_handler.engine.connect()
+        transaction = connection.begin()
+        # Commits inside the handler only release a SAVEPOINT
+        shared_auth_handler.db_session = Session(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
+
+        yield shared_auth_handler
+
+        shared_auth_handler.db_session.close()
+        transaction.rollback()
+        connection.close()
+        shared_auth_handler.db_session = module_session
 
     def test_register_student(self, auth_handler):
         """Test student registration."""
@@ -114,22 +172,20 @@ class TestAuthHandler:
         assert token is not None
         assert len(token) > 0
 
-    def test_login_success(self, auth_handler):
+    def test_login_success(self, auth_handler, registered_user):
         """Test successful login."""
-        auth_handler.register_student("test@demo.school.com", 9)
-        auth_handler.setup_password("test@demo.school.com", "SecurePass123")
+        email, password = registered_user
 
-        success, message, token = auth_handler.login("test@demo.school.com", "SecurePass123")
+        success, message, token = auth_handler.login(email, password)
 
         assert success is True
         assert token is not None
 
-    def test_login_wrong_password(self, auth_handler):
+    def test_login_wrong_password(self, auth_handler, registered_user):
         """Test login with wrong password."""
-        auth_handler.register_student("test@demo.school.com", 9)
-        auth_handler.setup_password("test@demo.school.com", "SecurePass123")
+        email, _ = registered_user
 
-        success, message, token = auth_handler.login("test@demo.school.com", "WrongPassword")
+        success, message, token = auth_handler.login(email, "WrongPassword")
 
         assert success is False
         assert token is None
@@ -146,10 +202,9 @@ class TestSessionManager:
     """Tests for SessionManager class."""
 
     @pytest.fixture
-    def session_manager(self):
-        """Create a SessionManager instance."""
-        from auth.session_manager import SessionManager
-        return SessionManager()
+    def session_manager(self, shared_session_manager):
+        """Get the shared SessionManager instance."""
+        return shared_session_manager
 
     def test_create_session(self, session_manager):
         """Test session token creation."""
@@ -88,3 +88,25 @@ class TestGetConfig:
         config2 = get_config()
 
         assert config1 is config2
+
+    def test_env_change_rebuilds_config(self, monkeypatch):
+        """Test that get_config picks up changed environment overrides."""
+        from config import get_config
+
+        monkeypatch.setenv("CHUNK_SIZE", "2000")
+        config1 = get_config()
+        monkeypatch.setenv("CHUNK_SIZE", "2500")
+        config2 = get_config()
+
+        assert config1.CHUNK_SIZE == 2000
+        assert config2.CHUNK_SIZE == 2500
+        assert get_config() is config2
+
+    def test_clear_config_cache_rebuilds_config(self):
+        """Test that clear_config_cache makes get_config build a new instance."""
+        from config import get_config, clear_config_cache
+
+        config1 = get_config()
+        clear_config_cache()
+
+        assert get_config() is not config1
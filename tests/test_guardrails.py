@@ -70,6 +70,37 @@ class TestResponseGuardrails:
             assert is_valid is False, f"Should flag: {response}"
             assert any("forbidden" in v.lower() for v in violations), f"Should have forbidden phrase violation: {response}"
 
+    def test_check_forbidden_phrases_reports_each_phrase(self, guardrails):
+        """Test that every distinct forbidden phrase is reported once."""
+        response = "I recommend this. You should definitely try it. I recommend it again."
+
+        found = guardrails.check_forbidden_phrases(response)
+
+        assert found == ["i recommend", "you should definitely"]
+
+    def test_count_paragraphs_ignores_blank_chunks(self, guardrails):
+        """Test that only non-blank paragraphs are counted."""
+        response = "First paragraph.\n\n   \n\nSecond paragraph.\n\n\nThird.\n\n"
+
+        assert guardrails.count_paragraphs(response) == 3
+        assert guardrails.count_paragraphs("") == 0
+
+    def test_is_valid_matches_validate_response(self, guardrails, states):
+        """Test that the boolean fast path agrees with full validation."""
+        responses = [
+            "",
+            "What do you enjoy? What are your hobbies?",
+            "That's great! 😊🎉 Let's talk.",
+            "I recommend you take science stream.",
+            "One.\n\nTwo.\n\nThree.\n\nFour.\n\nFive.\n\nSix.",
+            "Engineering involves solving real-world problems. What interests you?",
+        ]
+
+        for state in states:
+            for response in responses:
+                expected, _ = guardrails.validate_response(response, state)
+                assert guardrails.is_valid(response, state) is expected, f"{state.name}: {response!r}"
+
     def test_response_too_long(self, guardrails, states):
         """Test that very long responses are flagged."""
         # Create a very long response
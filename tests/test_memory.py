@@ -77,6 +77,29 @@ class TestProfileExtractor:
         )
         assert total_extractions == 0
 
+    def test_extract_from_conversation_skips_repeats(self, extractor):
+        """Test that empty and repeated user messages are only extracted once."""
+        messages = [
+            {"role": "user", "content": "I enjoy solving math problems"},
+            {"role": "user", "content": "   "},
+            {"role": "user", "content": "I enjoy solving math problems"},
+        ]
+
+        result = extractor.extract_from_conversation(messages)
+
+        assert len(result["interests"]) == 1
+
+    def test_extract_from_conversation_dedupes_spacing_variants(self, extractor):
+        """Test that phrases differing only in spacing count as one extraction."""
+        messages = [
+            {"role": "user", "content": "I enjoy playing  games"},
+            {"role": "user", "content": "I enjoy playing games"},
+        ]
+
+        result = extractor.extract_from_conversation(messages)
+
+        assert [item["content"] for item in result["interests"]] == ["playing games"]
+
 
 class TestMemoryStore:
     """Tests for MemoryStore class."""
@@ -124,6 +147,13 @@ class TestMemoryStore:
         assert "reading" in profile["interests"]
         assert "gaming" in profile["interests"]
 
+    def test_update_profile_creates_missing_profile(self, store):
+        """Test that updating an unknown student creates the profile too."""
+        store.update_profile(student_id=2, extractions={"dislikes": [{"content": "essays", "confidence": 0.8}]})
+
+        profile = store.get_profile_summary(student_id=2)
+        assert profile["dislikes"] == ["essays"]
+
 
 class TestMemoryReferencer:
     """Tests for MemoryReferencer class."""
@@ -183,3 +213,15 @@ class TestMemoryReferencer:
         # Context should mention their interests when include_reference is True
         if len(context) > 0:
             assert "technology" in context.lower() or "interest" in context.lower()
+
+    def test_build_memory_context_sees_profile_updates(self, referencer):
+        """Test that cached memory context is rebuilt after a profile update."""
+        store = referencer.memory_store
+        store.update_profile(student_id=1, extractions={"interests": [{"content": "drawing", "confidence": 0.8}]})
+        assert "drawing" in referencer.build_memory_context(student_id=1)
+
+        store.update_profile(student_id=1, extractions={"interests": [{"content": "robotics", "confidence": 0.8}]})
+        context = referencer.build_memory_context(student_id=1)
+
+        assert "drawing" in context
+        assert "robotics" in context
@@ -0,0 +1,60 @@
+"""
+Tests for system and state prompt building.
+"""
+import pytest
+
+
+class TestSystemPrompt:
+    """Tests for SystemPrompt class."""
+
+    @pytest.fixture
+    def system_prompt(self):
+        """Create a SystemPrompt instance."""
+        from prompts import SystemPrompt
+        return SystemPrompt()
+
+    @pytest.fixture
+    def state_prompts(self):
+        """Create a StatePrompts instance."""
+        from prompts import StatePrompts
+        return StatePrompts()
+
+    def test_build_prompt_for_state_matches_full_build(self, system_prompt, state_prompts, conversation_states):
+        """Test that the prebuilt per-state prefix gives the same prompt."""
+        for state in conversation_states:
+            expected = system_prompt.build_prompt_with_context(
+                state_instructions=state_prompts.get_state_prompt(state),
+                memory_context="Likes drawing",
+                rag_context="Architects design buildings"
+            )
+
+            assert system_prompt.build_prompt_for_state(
+                state,
+                memory_context="Likes drawing",
+                rag_context="Architects design buildings"
+            ) == expected
+
+    def test_static_sections_come_first(self, system_prompt):
+        """Test that state instructions precede per-turn context."""
+        prompt = system_prompt.build_prompt_with_context(
+            state_instructions="STATE",
+            memory_context="MEMORY",
+            rag_context="RAG"
+        )
+
+        assert prompt.index("STATE") < prompt.index("MEMORY") < prompt.index("RAG")
+
+
+class TestStatePrompts:
+    """Tests for StatePrompts class."""
+
+    @pytest.fixture
+    def state_prompts(self):
+        """Create a StatePrompts instance."""
+        from prompts import StatePrompts
+        return StatePrompts()
+
+    def test_get_state_prompt_returns_state_template(self, state_prompts, conversation_states):
+        """Test that every state maps to its own template."""
+        for state in conversation_states:
+            assert state_prompts.get_state_prompt(state) == state_prompts.TEMPLATES[state]
@@ -0,0 +1,28 @@
+"""
+Tests for input sanitization.
+"""
+import pytest
+
+
+class TestSanitizeInput:
+    """Tests for sanitize_input."""
+
+    @pytest.fixture
+    def sanitize(self):
+        """Get the sanitize_input function."""
+        from utils.sanitization import sanitize_input
+        return sanitize_input
+
+    def test_normalizes_whitespace(self, sanitize):
+        """Test that whitespace runs collapse and ends are trimmed."""
+        assert sanitize("  hi \n\t there  ") == "hi there"
+
+    def test_removes_script_blocks(self, sanitize):
+        """Test that script tags are removed together with their body."""
+        assert sanitize("hi <script>alert(1)</script> <b>there</b>") == "hi  there"
+
+    def test_stray_angle_bracket_does_not_expose_script_body(self, sanitize):
+        """Test that a '<' before a script tag can't leave the script body behind."""
+        assert sanitize("if a<b then <script>steal()</script>") == "if a<b then"
+        assert sanitize("x < y <script>alert(document.cookie)</script> z") == "x < y  z"
+        assert sanitize("<<script>x</script>b>") == ""
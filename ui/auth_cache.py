@@ -0,0 +1,24 @@
+"""Process-wide AuthHandler shared by the auth pages"""
+from pathlib import Path
+
+import streamlit as st
+
+from auth import AuthHandler
+from utils import get_secret
+
+# Same database the main app uses
+DB_PATH = Path(__file__).parent.parent.resolve() / "data" / "buddy_ai.db"
+
+
+@st.cache_resource
+def get_auth_handler() -> AuthHandler:
+    """
+    Get the AuthHandler shared by every page.
+
+    Defined once here so that login and forgot-password hit the same
+    st.cache_resource entry instead of each holding its own handler.
+    """
+    return AuthHandler(
+        db_path=str(DB_PATH),
+        secret_key=get_secret("JWT_SECRET_KEY")
+    )
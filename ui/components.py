@@ -1,25 +1,68 @@
 """UI components for Buddy AI"""
+import html
+from typing import Dict
+
 import streamlit as st
 from chat.manager import format_timestamp, get_active_messages
 
+# Static markup, written flush-left so Streamlit has nothing to dedent
+_HEADER_HTML = """
+<div class="custom-header">
+    <div class="header-left">
+        <button class="hamburger-btn" onclick="window.parent.postMessage({type: 'toggleSidebar'}, '*')">
+            <span></span>
+            <span></span>
+            <span></span>
+        </button>
+    </div>
+    <div class="header-center">
+        <span class="header-title">Buddy AI</span>
+    </div>
+    <div class="header-right"></div>
+</div>
+"""
+
+_WELCOME_HTML = """
+<div class="welcome-container">
+    <div class="welcome-icon">🎓</div>
+    <h2 class="welcome-title">Welcome to Buddy AI!</h2>
+    <p class="welcome-subtitle">
+        I'm your friendly career guide. Ask me about careers, skills,
+        education paths, or anything about your future!
+    </p>
+</div>
+"""
+
+_SIDEBAR_OVERLAY_HTML = '<div class="sidebar-overlay-active"></div>'
+_SIDEBAR_TITLE_HTML = '<div style="color: white; font-size: 1.1rem; font-weight: 600; padding: 10px 0;">🎓 Buddy AI</div>'
+_PAST_CHATS_HEADER_HTML = '<p style="color: rgba(255,255,255,0.5); font-size: 0.75rem; text-transform: uppercase;">Past Chats</p>'
+_NO_CHATS_HTML = '<p style="color: rgba(255,255,255,0.4); text-align: center; padding: 20px;">No chats yet</p>'
+
 
 def render_header() -> None:
     """Render the custom header - CLAUDE.md spec: #004aad, white text, Lora font"""
-    st.markdown("""
-    <div class="custom-header">
-        <div class="header-left">
-            <button class="hamburger-btn" onclick="window.parent.postMessage({type: 'toggleSidebar'}, '*')">
-                <span></span>
-                <span></span>
-                <span></span>
-            </button>
-        </div>
-        <div class="header-center">
-            <span class="header-title">Buddy AI</span>
-        </div>
-        <div class="header-right"></div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+
+
+def _get_sidebar_labels() -> Dict[str, str]:
+    """
+    Get {chat_id: label} for the sidebar chat list.
+
+    Labels are rebuilt only when the chat list changes and are otherwise
+    reused across reruns. Timestamps aren't cached: a chat's updated_at
+    moves with every message, so it is read from the chat list on render.
+    """
+    version = st.session_state.get("chat_list_version", 0)
+    cached = st.session_state.get("_sidebar_labels")
+    if cached and cached[0] == version:
+        return cached[1]
+
+    labels = {}
+    for chat in st.session_state.chat_list:
+        labels[chat["id"]] = f"💬 {chat['title'][:22]}..." if len(chat['title']) > 22 else f"💬 {chat['title']}"
+
+    st.session_state._sidebar_labels = (version, labels)
+    return labels
 
 
 def render_sidebar() -> None:
@@ -27,12 +70,12 @@ def render_sidebar() -> None:
     from chat.manager import create_new_chat, delete_chat, save_chat_history, switch_to_chat
 
     # Dark overlay
-    st.markdown('<div class="sidebar-overlay-active"></div>', unsafe_allow_html=True)
+    st.markdown(_SIDEBAR_OVERLAY_HTML, unsafe_allow_html=True)
 
     # Close button row
     close_col1, close_col2 = st.columns([4, 1])
     with close_col1:
-        st.markdown('<div style="color: white; font-size: 1.1rem; font-weight: 600; padding: 10px 0;">🎓 Buddy AI</div>', unsafe_allow_html=True)
+        st.markdown(_SIDEBAR_TITLE_HTML, unsafe_allow_html=True)
     with close_col2:
         if st.button("✕", key="close_sidebar_btn", help="Close"):
             st.session_state.sidebar_open = False
@@ -48,25 +91,27 @@ def render_sidebar() -> None:
     st.markdown("---")
 
     # Menu option 2: Past Chats
-    st.markdown('<p style="color: rgba(255,255,255,0.5); font-size: 0.75rem; text-transform: uppercase;">Past Chats</p>', unsafe_allow_html=True)
+    st.markdown(_PAST_CHATS_HEADER_HTML, unsafe_allow_html=True)
 
     if not st.session_state.chat_list:
-        st.markdown('<p style="color: rgba(255,255,255,0.4); text-align: center; padding: 20px;">No chats yet</p>', unsafe_allow_html=True)
+        st.markdown(_NO_CHATS_HTML, unsafe_allow_html=True)
     else:
+        labels = _get_sidebar_labels()
+        current_chat_id = st.session_state.current_chat_id
         for chat in st.session_state.chat_list:
+            chat_id = chat["id"]
+            btn_type = "primary" if chat_id == current_chat_id else "secondary"
             chat_col1, chat_col2 = st.columns([5, 1])
             with chat_col1:
-                btn_type = "primary" if chat["id"] == st.session_state.current_chat_id else "secondary"
-                title = f"💬 {chat['title'][:22]}..." if len(chat['title']) > 22 else f"💬 {chat['title']}"
-                if st.button(title, key=f"sidebar_chat_{chat['id']}", use_container_width=True, type=btn_type):
-                    switch_to_chat(chat['id'])
+                if st.button(labels[chat_id], key=f"sidebar_chat_{chat_id}", use_container_width=True, type=btn_type):
+                    switch_to_chat(chat_id)
                     st.session_state.sidebar_open = False
                     st.rerun()
             with chat_col2:
-                if st.button("🗑️", key=f"sidebar_del_{chat['id']}"):
-                    if st.session_state.current_chat_id == chat['id']:
+                if st.button("🗑️", key=f"sidebar_del_{chat_id}"):
+                    if current_chat_id == chat_id:
                         st.session_state.current_chat_id = None
-                    delete_chat(chat['id'])
+                    delete_chat(chat_id)
                     st.rerun()
             st.markdown(f'<p style="color: rgba(255,255,255,0.4); font-size: 0.7rem; margin-top: -10px; padding-left: 10px;">{format_timestamp(chat["updated_at"])}</p>', unsafe_allow_html=True)
 
@@ -83,48 +128,51 @@ def render_sidebar() -> None:
         st.stop()
 
 
+# Welcome screen chips: label shown -> question sent
+SUGGESTION_CHIPS = {
+    "💼 What careers suit me?": "What careers would suit my personality and interests?",
+    "🛠️ Best skills to learn": "What are the best skills to learn for my future career?",
+    "🎓 How to become an engineer?": "How do I become an engineer? What are the steps?",
+    "💻 Career in tech": "Tell me about careers in the tech industry",
+}
+
+
+def _on_suggestion_chip() -> None:
+    """Queue the clicked chip's question and clear the selection"""
+    label = st.session_state.welcome_chips
+    if label:
+        st.session_state.suggestion_clicked = SUGGESTION_CHIPS[label]
+    st.session_state.welcome_chips = None
+
+
 def render_welcome() -> None:
     """Render the welcome screen with suggestion chips"""
-    st.markdown("""
-    <div class="welcome-container">
-        <div class="welcome-icon">🎓</div>
-        <h2 class="welcome-title">Welcome to Buddy AI!</h2>
-        <p class="welcome-subtitle">
-            I'm your friendly career guide. Ask me about careers, skills,
-            education paths, or anything about your future!
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Clickable suggestion chips
-    st.markdown('<div style="display: flex; justify-content: center; margin-top: -20px;">', unsafe_allow_html=True)
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("💼 What careers suit me?", key="suggest_1", use_container_width=True):
-            st.session_state.suggestion_clicked = "What careers would suit my personality and interests?"
-            st.rerun()
-        if st.button("🎓 How to become an engineer?", key="suggest_3", use_container_width=True):
-            st.session_state.suggestion_clicked = "How do I become an engineer? What are the steps?"
-            st.rerun()
-    with col2:
-        if st.button("🛠️ Best skills to learn", key="suggest_2", use_container_width=True):
-            st.session_state.suggestion_clicked = "What are the best skills to learn for my future career?"
-            st.rerun()
-        if st.button("💻 Career in tech", key="suggest_4", use_container_width=True):
-            st.session_state.suggestion_clicked = "Tell me about careers in the tech industry"
-            st.rerun()
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(_WELCOME_HTML, unsafe_allow_html=True)
+
+    # Clickable suggestion chips, rendered as a single pills widget
+    st.pills(
+        "Suggestions",
+        list(SUGGESTION_CHIPS),
+        key="welcome_chips",
+        on_change=_on_suggestion_chip,
+        label_visibility="collapsed"
+    )
 
 
 def render_messages() -> None:
     """Render chat messages from the active chat (single source of truth)"""
-    messages = get_active_messages()
-    for msg in messages:
+    # One markdown element for the whole history instead of one per
+    # message, so a rerun sends a single delta to the browser
+    parts = []
+    for msg in get_active_messages():
         role_class = msg["role"]
         avatar = "🎓" if msg["role"] == "assistant" else "👤"
-        st.markdown(f"""
-        <div class="message-container {role_class}">
-            <div class="message-avatar">{avatar}</div>
-            <div class="message-bubble">{msg["content"]}</div>
-        </div>
-        """, unsafe_allow_html=True)
+        parts.append(
+            f'<div class="message-container {role_class}">'
+            f'<div class="message-avatar">{avatar}</div>'
+            f'<div class="message-bubble">{html.escape(msg["content"])}</div>'
+            f'</div>'
+        )
+
+    if parts:
+        st.markdown("\n".join(parts), unsafe_allow_html=True)
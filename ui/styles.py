@@ -1,15 +1,52 @@
 """CSS styles for Buddy AI - matching CLAUDE.md and Figma specs"""
+import re
+from pathlib import Path
+
 import streamlit as st
 
-# Complete CSS matching CLAUDE.md: header #004aad, Lora font, user bubble #DBEAFE
-MAIN_STYLES = """
-<!-- Preload fonts to prevent FOUT -->
+# Shared stylesheet for the login and forgot-password pages
+AUTH_CSS_FILE = Path(__file__).parent.parent.resolve() / "static" / "auth.css"
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};,])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """
+    Strip comments and redundant whitespace from a stylesheet.
+
+    Deliberately conservative: only whitespace around braces, semicolons
+    and commas is removed, so selectors, calc() expressions and quoted
+    values keep their meaning.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_SPACE_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+# Preload fonts to prevent FOUT. Loaded with <link> rather than a CSS
+# @import so the request isn't chained behind parsing the stylesheet.
+# Only the weights a selector actually uses: Lora for the 600 header and
+# 700 welcome titles, Inter for body text and 600 bold text
+FONT_LINKS = """
 <link rel="preconnect" href="https://fonts.googleapis.com">
 <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-<link href="https://fonts.googleapis.com/css2?family=Lora:wght@400;500;600;700&family=Inter:wght@400;500;600&display=swap" rel="stylesheet">
+<link href="https://fonts.googleapis.com/css2?family=Lora:wght@600;700&family=Inter:wght@400;600&display=swap" rel="stylesheet">
+"""
+
+# Complete CSS matching CLAUDE.md: header #004aad, Lora font, user bubble #DBEAFE
+_MAIN_CSS = """
+    /* Main app container with GPU acceleration. The custom properties
+       live here rather than on :root since only .stApp and its
+       descendants read them. */
+    .stApp {
+        background: var(--bg-main) !important;
+        transform: translateZ(0);
+        -webkit-backface-visibility: hidden;
+        backface-visibility: hidden;
 
-<style>
-    :root {
         --primary: #004aad;
         --primary-dark: #003a8c;
         --primary-light: #0066cc;
@@ -29,17 +66,13 @@ MAIN_STYLES = """
         --input-height: 70px;
     }
 
-    /* Global Reset with smooth transitions */
+    /* Global Reset. Transitions are declared only on the interactive
+       elements that change on hover/focus, not on every node. */
     * {
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
         box-sizing: border-box;
     }
 
-    /* Smooth transitions globally */
-    *, *::before, *::after {
-        transition: background-color 0.15s ease, border-color 0.15s ease, box-shadow 0.15s ease;
-    }
-
     /* Hide Streamlit defaults */
     #MainMenu, footer, header {display: none !important;}
     .stDeployButton {display: none !important;}
@@ -53,17 +86,11 @@ MAIN_STYLES = """
         scroll-behavior: smooth;
     }
 
-    /* Main app container with GPU acceleration */
-    .stApp {
-        background: var(--bg-main) !important;
-        transform: translateZ(0);
-        -webkit-backface-visibility: hidden;
-        backface-visibility: hidden;
-    }
-
     .main .block-container {
         padding: 0 !important;
         max-width: 100% !important;
+        /* No paint containment: it would clip the fixed header and chat
+           input rendered inside, and the chips' hover shadows */
         contain: layout style;
     }
 
@@ -83,7 +110,6 @@ MAIN_STYLES = """
         z-index: 1000;
         /* GPU acceleration for smooth fixed positioning */
         transform: translateZ(0);
-        will-change: transform;
         -webkit-backface-visibility: hidden;
         backface-visibility: hidden;
     }
@@ -151,12 +177,13 @@ MAIN_STYLES = """
         /* Smooth scrolling */
         scroll-behavior: smooth;
         -webkit-overflow-scrolling: touch;
-        /* Prevent layout shifts */
-        contain: layout style;
+        /* Prevent layout shifts; it scrolls, so nothing paints outside */
+        contain: content;
     }
 
     /* Reduce Streamlit rerun jitter */
     [data-testid="stVerticalBlock"] {
+        /* layout style only, like .block-container above */
         contain: layout style;
     }
 
@@ -187,13 +214,19 @@ MAIN_STYLES = """
         font-size: 3rem;
         margin-bottom: 24px;
         box-shadow: 0 8px 24px rgba(0, 74, 173, 0.25);
-        /* Subtle pulse animation */
-        animation: subtlePulse 3s ease-in-out infinite;
+    }
+
+    /* Subtle pulse animation. Only transform is animated so the loop
+       stays on the compositor instead of repainting the shadow. */
+    @media (prefers-reduced-motion: no-preference) {
+        .welcome-icon {
+            animation: subtlePulse 3s ease-in-out infinite;
+        }
     }
 
     @keyframes subtlePulse {
-        0%, 100% { transform: scale(1); box-shadow: 0 8px 24px rgba(0, 74, 173, 0.25); }
-        50% { transform: scale(1.02); box-shadow: 0 10px 28px rgba(0, 74, 173, 0.3); }
+        0%, 100% { transform: scale(1); }
+        50% { transform: scale(1.02); }
     }
 
     .welcome-title,
@@ -282,9 +315,15 @@ MAIN_STYLES = """
         display: flex;
         margin-bottom: 16px;
         animation: fadeIn 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        /* GPU acceleration */
+        /* GPU acceleration. No will-change: the browser promotes the
+           layer by itself while fadeIn runs, and dozens of messages would
+           otherwise each hold a compositor layer at rest. */
         transform: translateZ(0);
-        will-change: opacity, transform;
+        /* Skip layout and paint for messages scrolled out of view; the
+           placeholder height (or the last rendered one) keeps the
+           scrollbar stable meanwhile */
+        content-visibility: auto;
+        contain-intrinsic-size: 0 auto 80px;
     }
 
     @keyframes fadeIn {
@@ -413,7 +452,6 @@ MAIN_STYLES = """
         z-index: 999 !important;
         /* GPU acceleration for smooth fixed positioning */
         transform: translateZ(0) !important;
-        will-change: transform !important;
         -webkit-backface-visibility: hidden !important;
         backface-visibility: hidden !important;
     }
@@ -425,6 +463,7 @@ MAIN_STYLES = """
         border: 1px solid var(--border-color) !important;
         border-radius: 25px !important;
         overflow: hidden !important;
+        transition: border-color 0.15s ease, box-shadow 0.15s ease;
     }
 
     [data-testid="stChatInput"] > div:focus-within {
@@ -453,6 +492,7 @@ MAIN_STYLES = """
         min-height: 40px !important;
         margin: 4px !important;
         border: none !important;
+        transition: background-color 0.15s ease, transform 0.15s ease;
     }
 
     [data-testid="stChatInput"] button:hover {
@@ -492,11 +532,9 @@ MAIN_STYLES = """
             margin-right: auto;
         }
     }
-</style>
 """
 
-SIDEBAR_STYLES = """
-<style>
+_SIDEBAR_CSS = """
     /* Sidebar overlay with fade */
     .sidebar-overlay-active {
         position: fixed;
@@ -529,7 +567,6 @@ SIDEBAR_STYLES = """
         animation: slideIn 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
         /* GPU acceleration */
         transform: translateZ(0);
-        will-change: transform;
         -webkit-backface-visibility: hidden;
         backface-visibility: hidden;
     }
@@ -544,6 +581,7 @@ SIDEBAR_STYLES = """
         background: rgba(255,255,255,0.1) !important;
         border: 1px solid rgba(255,255,255,0.2) !important;
         color: white !important;
+        transition: background-color 0.15s ease;
     }
 
     [data-testid="stVerticalBlock"]:has(button[key="close_sidebar_btn"]) button:hover {
@@ -560,9 +598,13 @@ SIDEBAR_STYLES = """
         border-color: rgba(255,255,255,0.1) !important;
         margin: 16px 0 !important;
     }
-</style>
 """
 
+# The sources above stay readable; what is sent on every rerun is minified
+# once at import
+MAIN_STYLES = f"{FONT_LINKS}<style>{_minify_css(_MAIN_CSS)}</style>"
+SIDEBAR_STYLES = f"<style>{_minify_css(_SIDEBAR_CSS)}</style>"
+
 
 def inject_styles() -> None:
     """Inject all CSS styles into the page"""
@@ -572,3 +614,14 @@ def inject_styles() -> None:
 def inject_sidebar_styles() -> None:
     """Inject sidebar-specific styles"""
     st.markdown(SIDEBAR_STYLES, unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
+def _load_auth_css() -> str:
+    """Read the auth page stylesheet once per process"""
+    return _minify_css(AUTH_CSS_FILE.read_text(encoding="utf-8"))
+
+
+def inject_auth_styles() -> None:
+    """Inject the styles shared by the auth pages"""
+    st.markdown(f"{FONT_LINKS}<style>{_load_auth_css()}</style>", unsafe_allow_html=True)
@@ -2,11 +2,13 @@
 from .sanitization import sanitize_input
 from .rate_limiter import check_rate_limit, RATE_LIMIT_MESSAGES, RATE_LIMIT_WINDOW
 from .retry import retry_with_backoff
+from .secret_loader import get_secret
 
 __all__ = [
     'sanitize_input',
     'check_rate_limit',
     'RATE_LIMIT_MESSAGES',
     'RATE_LIMIT_WINDOW',
-    'retry_with_backoff'
+    'retry_with_backoff',
+    'get_secret'
 ]
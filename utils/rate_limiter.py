@@ -1,5 +1,7 @@
 """Rate limiting for API protection"""
 import time
+from collections import deque
+
 import streamlit as st
 
 # Rate limiting configuration
@@ -14,22 +16,23 @@ def check_rate_limit() -> bool:
     Returns:
         True if request is allowed, False if rate limited
     """
-    now = time.time()
+    # Monotonic so wall-clock adjustments can't reopen or stretch the window
+    now = time.monotonic()
 
-    # Initialize rate limit tracking
-    if "message_timestamps" not in st.session_state:
-        st.session_state.message_timestamps = []
+    # Initialize rate limit tracking. The deque is mutated in place, so
+    # session state is never reassigned after this.
+    timestamps = st.session_state.setdefault(
+        "message_timestamps", deque(maxlen=RATE_LIMIT_MESSAGES)
+    )
 
-    # Remove timestamps outside the window
-    st.session_state.message_timestamps = [
-        ts for ts in st.session_state.message_timestamps
-        if now - ts < RATE_LIMIT_WINDOW
-    ]
+    # Timestamps are appended in order, so expired ones are all at the left
+    while timestamps and now - timestamps[0] >= RATE_LIMIT_WINDOW:
+        timestamps.popleft()
 
     # Check if under limit
-    if len(st.session_state.message_timestamps) >= RATE_LIMIT_MESSAGES:
+    if len(timestamps) >= RATE_LIMIT_MESSAGES:
         return False
 
     # Add current timestamp
-    st.session_state.message_timestamps.append(now)
+    timestamps.append(now)
     return True
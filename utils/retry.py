@@ -1,5 +1,6 @@
 """Retry logic with exponential backoff"""
 import time
+import random
 import logging
 from typing import Callable, TypeVar, Any
 
@@ -7,6 +8,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Upper bound on a single backoff sleep, in seconds
+MAX_DELAY = 30.0
+
 
 def retry_with_backoff(
     func: Callable[[], T],
@@ -17,10 +21,14 @@ def retry_with_backoff(
     """
     Execute function with exponential backoff retry logic.
 
+    Each sleep is drawn uniformly from zero up to the exponential delay
+    (full jitter), so sessions that failed together don't all retry at
+    the same instant.
+
     Args:
         func: Function to execute (no arguments)
         max_retries: Maximum number of retry attempts
-        base_delay: Initial delay in seconds (doubles each retry)
+        base_delay: Initial delay cap in seconds (doubles each retry)
         exceptions: Tuple of exceptions to catch and retry
 
     Returns:
@@ -37,8 +45,8 @@ def retry_with_backoff(
         except exceptions as e:
             last_exception = e
             if attempt < max_retries - 1:
-                delay = base_delay * (2 ** attempt)
-                logger.warning(f"Retry {attempt + 1}/{max_retries} after {delay}s: {e}")
+                delay = min(random.uniform(0, base_delay * (1 << attempt)), MAX_DELAY)
+                logger.warning(f"Retry {attempt + 1}/{max_retries} after {delay:.2f}s: {e}")
                 time.sleep(delay)
 
     raise last_exception
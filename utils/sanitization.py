@@ -1,6 +1,16 @@
 """Input sanitization utilities for security"""
 import re
 
+# Compiled once per process. Kept as two passes: in a single alternation
+# a stray '<' (as in "a<b") lets the generic tag branch swallow a following
+# <script> tag, leaving the script body in the output.
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Anything text.split() would change: a whitespace run, whitespace other
+# than a plain space, or whitespace at either end
+_UNNORMALIZED_WS_RE = re.compile(r'\s\s|[^\S ]|^\s|\s$')
+
 
 def sanitize_input(text: str, max_length: int = 2000) -> str:
     """
@@ -16,15 +26,27 @@ def sanitize_input(text: str, max_length: int = 2000) -> str:
     if not text:
         return ""
 
+    # Bound the work below for oversized input. Twice the cap leaves room
+    # for whitespace that normalization collapses away.
+    if len(text) > max_length * 2:
+        text = text[:max_length * 2]
+
     # Remove excessive whitespace
-    text = " ".join(text.split())
+    if _UNNORMALIZED_WS_RE.search(text):
+        text = " ".join(text.split())
 
     # Limit length to prevent abuse
     if len(text) > max_length:
         text = text[:max_length] + "..."
 
-    # Remove potential script tags (basic XSS prevention for display)
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r'<[^>]+>', '', text)  # Remove HTML tags
-
-    return text.strip()
+    # Remove potential script tags and other HTML tags (basic XSS
+    # prevention for display). Both need a '<', which most chat messages
+    # never contain. Text without one is already trimmed by the
+    # normalization above.
+    if '<' in text:
+        text = _SCRIPT_RE.sub('', text)
+        text = _TAG_RE.sub('', text)  # Remove HTML tags
+        # A removed tag can leave whitespace at either end
+        text = text.strip()
+
+    return text
@@ -0,0 +1,17 @@
+"""Secret lookup shared by the app and its pages"""
+import os
+from typing import Optional
+
+import streamlit as st
+
+
+def get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Get secret from Streamlit secrets or environment variables"""
+    # Try Streamlit secrets first (for cloud deployment)
+    try:
+        if hasattr(st, 'secrets') and key in st.secrets:
+            return st.secrets[key]
+    except Exception:
+        pass
+    # Fall back to environment variables (for local development)
+    return os.getenv(key, default)